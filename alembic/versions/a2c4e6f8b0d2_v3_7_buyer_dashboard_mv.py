@@ -0,0 +1,63 @@
+"""v3.7 buyer_dashboard_mv materialized view
+
+Revision ID: a2c4e6f8b0d2
+Revises: f0b2d4a6c8e0
+Create Date: 2026-08-27 11:00:00.000000
+
+buyer 대시보드 예약 섹션의 스칼라들을 buyer_id별 한 행으로 미리 집계해 두는
+materialized view. Postgres 전용 — SQLite(dev)는 MV가 없으므로 no-op이고
+라우터가 라이브 집계로 폴백한다. refresh는 main.py의 워커가
+REFRESH MATERIALIZED VIEW CONCURRENTLY 로 주기 실행.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a2c4e6f8b0d2"
+down_revision: Union[str, Sequence[str], None] = "f0b2d4a6c8e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_MV_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS buyer_dashboard_mv AS
+SELECT
+    buyer_id,
+    COUNT(*)                                                                 AS total,
+    COUNT(*) FILTER (WHERE status::text = 'PAID')                            AS paid,
+    COUNT(*) FILTER (WHERE status::text = 'CANCELLED')                       AS cancelled,
+    COUNT(*) FILTER (WHERE status::text = 'EXPIRED')                         AS expired,
+    COALESCE(SUM(amount_total) FILTER (WHERE status::text = 'PAID'), 0)      AS paid_total,
+    COALESCE(SUM(amount_total) FILTER (WHERE status::text = 'CANCELLED'), 0) AS cancelled_total,
+    COUNT(*) FILTER (WHERE status::text = 'PAID' AND shipped_at IS NULL)     AS paid_not_shipped,
+    COUNT(*) FILTER (WHERE status::text = 'PAID'
+                     AND shipped_at IS NOT NULL
+                     AND arrival_confirmed_at IS NULL)                       AS shipped_not_arrived,
+    COUNT(*) FILTER (WHERE status::text = 'PAID'
+                     AND arrival_confirmed_at IS NOT NULL)                   AS arrived_confirmed,
+    COUNT(*) FILTER (WHERE status::text = 'CANCELLED'
+                     AND paid_at IS NOT NULL)                                AS cancelled_after_paid
+FROM reservations
+GROUP BY buyer_id
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute(_MV_SQL)
+    # CONCURRENTLY refresh에 unique index 필수
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_buyer_dashboard_mv "
+        "ON buyer_dashboard_mv (buyer_id)"
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS buyer_dashboard_mv")
@@ -0,0 +1,81 @@
+"""v3.7 buyer reservation counter columns
+
+Revision ID: c0d2e4f6a8b0
+Revises: a2c4e6f8b0d2
+Create Date: 2026-08-27 13:00:00.000000
+
+buyers 에 예약 상태별 비정규화 카운터 추가 — models.py 의 Reservation
+이벤트 리스너가 상태 전이마다 증감 유지하고, 대시보드 섹션3이
+GROUP BY 스캔 대신 buyer 행 PK 조회 한 번으로 읽는다.
+추가 직후 기존 reservations 로 백필해서 과거 데이터와 일치시킨다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d2e4f6a8b0"
+down_revision: Union[str, Sequence[str], None] = "a2c4e6f8b0d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTER_COLS = (
+    "resv_total_count",
+    "resv_paid_count",
+    "resv_cancelled_count",
+    "resv_expired_count",
+    "resv_paid_total_amt",
+    "resv_cancelled_total_amt",
+)
+
+# CAST(status AS TEXT): SQLite 는 문자열 그대로, Postgres 는 enum → text
+_BACKFILL_SQL = """
+UPDATE buyers SET
+    resv_total_count = COALESCE((
+        SELECT COUNT(*) FROM reservations r WHERE r.buyer_id = buyers.id), 0),
+    resv_paid_count = COALESCE((
+        SELECT COUNT(*) FROM reservations r
+        WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'PAID'), 0),
+    resv_cancelled_count = COALESCE((
+        SELECT COUNT(*) FROM reservations r
+        WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'CANCELLED'), 0),
+    resv_expired_count = COALESCE((
+        SELECT COUNT(*) FROM reservations r
+        WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'EXPIRED'), 0),
+    resv_paid_total_amt = COALESCE((
+        SELECT SUM(r.amount_total) FROM reservations r
+        WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'PAID'), 0),
+    resv_cancelled_total_amt = COALESCE((
+        SELECT SUM(r.amount_total) FROM reservations r
+        WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'CANCELLED'), 0)
+"""
+
+
+def _has_column(table: str, column: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(col["name"] == column for col in insp.get_columns(table))
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    added = False
+    for col in _COUNTER_COLS:
+        if not _has_column("buyers", col):
+            op.add_column(
+                "buyers",
+                sa.Column(col, sa.Integer(), nullable=False, server_default="0"),
+            )
+            added = True
+    if added:
+        op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    for col in _COUNTER_COLS:
+        if _has_column("buyers", col):
+            op.drop_column("buyers", col)
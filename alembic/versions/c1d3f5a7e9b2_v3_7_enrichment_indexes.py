@@ -0,0 +1,52 @@
+"""v3.7 seller enrichment indexes
+
+Revision ID: c1d3f5a7e9b2
+Revises: 4d995dedbf80
+Create Date: 2026-08-27 08:10:00.000000
+
+get_seller / list_sellers 의 레벨 enrichment가 타는 조회 경로 보강:
+- _get_seller_success_order_count: Reservation JOIN Offer + status=PAID
+  → reservations(offer_id, status) 복합 인덱스
+- buyer 측 동일 패턴 대비 reservations(buyer_id, status)
+seller_reviews(seller_id, created_at) / offers(seller_id) 는
+4d995dedbf80 에서 이미 보장됨.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d3f5a7e9b2"
+down_revision: Union[str, Sequence[str], None] = "4d995dedbf80"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_index(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(ix.get("name") == name for ix in insp.get_indexes(table))
+    except Exception:
+        return False
+
+
+def _ensure_index(name: str, table: str, cols, unique: bool = False):
+    if not _has_index(table, name):
+        op.create_index(name, table, cols, unique=unique)
+
+
+def upgrade() -> None:
+    # 모델(__table_args__)에는 이미 선언돼 있지만, reservations 테이블이
+    # 20251109 리비전으로 먼저 만들어진 기존 DB에는 인덱스가 없음
+    _ensure_index("ix_resv_offer_status", "reservations", ["offer_id", "status"])
+    _ensure_index("ix_resv_buyer_status", "reservations", ["buyer_id", "status"])
+
+
+def downgrade() -> None:
+    if _has_index("reservations", "ix_resv_offer_status"):
+        op.drop_index("ix_resv_offer_status", table_name="reservations")
+    if _has_index("reservations", "ix_resv_buyer_status"):
+        op.drop_index("ix_resv_buyer_status", table_name="reservations")
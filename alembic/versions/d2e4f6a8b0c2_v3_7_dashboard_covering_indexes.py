@@ -0,0 +1,68 @@
+"""v3.7 대시보드 커버링 인덱스
+
+Revision ID: d2e4f6a8b0c2
+Revises: c0d2e4f6a8b0
+Create Date: 2026-08-27 14:00:00.000000
+
+대시보드 집계가 타는 필터 (buyer_id, status) / (user_type, user_id) 에
+커버링 인덱스 추가. Postgres 는 INCLUDE 컬럼으로 힙 접근 없는
+index-only scan 이 되고, SQLite 는 INCLUDE 를 무시하고 복합 인덱스로만
+동작한다. 모델 선언(ix_resv_buyer_status / ix_point_user_dash)과 동일 —
+create_all 을 안 거친 기존 DB에 멱등하게 깔아줌.
+
+user_notifications(user_id, is_read) 는 f0b2d4a6c8e0 에서 이미 보장,
+buyer_deposits 테이블은 이 트리에 없어 제외.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e4f6a8b0c2"
+down_revision: Union[str, Sequence[str], None] = "c0d2e4f6a8b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    (
+        "ix_resv_buyer_status",
+        "reservations",
+        ["buyer_id", "status"],
+        ["amount_total", "paid_at", "shipped_at", "arrival_confirmed_at", "offer_id"],
+    ),
+    (
+        "ix_point_user_dash",
+        "point_transactions",
+        ["user_type", "user_id"],
+        ["amount"],
+    ),
+]
+
+
+def _has_index(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(ix["name"] == name for ix in insp.get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    pg = bind.dialect.name == "postgresql"
+    for name, table, cols, include in _INDEXES:
+        if _has_index(table, name):
+            if not pg:
+                continue
+            # INCLUDE 없는 기존 복합 인덱스를 커버링 버전으로 교체
+            op.drop_index(name, table_name=table)
+        op.create_index(name, table, cols, postgresql_include=include)
+
+
+def downgrade() -> None:
+    for name, table, _cols, _include in _INDEXES:
+        if _has_index(table, name):
+            op.drop_index(name, table_name=table)
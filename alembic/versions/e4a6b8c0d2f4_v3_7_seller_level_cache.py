@@ -0,0 +1,45 @@
+"""v3.7 seller level cache columns
+
+Revision ID: e4a6b8c0d2f4
+Revises: c1d3f5a7e9b2
+Create Date: 2026-08-27 09:00:00.000000
+
+seller_rating_aggregates 에 레벨 캐시 컬럼 추가 —
+compute_seller_level_info 결과(level/fee/total_orders)를 박제해서
+get_seller enrichment가 집계 대신 PK SELECT 한 번으로 읽게 함.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a6b8c0d2f4"
+down_revision: Union[str, Sequence[str], None] = "c1d3f5a7e9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(col["name"] == column for col in insp.get_columns(table))
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    if not _has_column("seller_rating_aggregates", "level"):
+        op.add_column("seller_rating_aggregates", sa.Column("level", sa.String(10), nullable=True))
+    if not _has_column("seller_rating_aggregates", "fee_percent"):
+        op.add_column("seller_rating_aggregates", sa.Column("fee_percent", sa.Float(), nullable=True))
+    if not _has_column("seller_rating_aggregates", "total_orders"):
+        op.add_column("seller_rating_aggregates", sa.Column("total_orders", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    for col in ("level", "fee_percent", "total_orders"):
+        if _has_column("seller_rating_aggregates", col):
+            op.drop_column("seller_rating_aggregates", col)
@@ -0,0 +1,41 @@
+"""v3.7 reservations (buyer_id, created_at) 인덱스
+
+Revision ID: e6a8b0c2d4f6
+Revises: d2e4f6a8b0c2
+Create Date: 2026-08-27 15:00:00.000000
+
+대시보드 SLA 스캔이 최근 N일(DASH_SLA_WINDOW_DAYS, 기본 90) 창으로
+created_at 필터를 타게 되어 지원 인덱스 추가. 모델 선언과 동일.
+now() 기반 부분 인덱스는 Postgres 에서 predicate 가 IMMUTABLE 이어야 해
+불가 — 일반 복합 인덱스로 대신한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a8b0c2d4f6"
+down_revision: Union[str, Sequence[str], None] = "d2e4f6a8b0c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_index(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(ix["name"] == name for ix in insp.get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    if not _has_index("reservations", "ix_resv_buyer_created"):
+        op.create_index("ix_resv_buyer_created", "reservations", ["buyer_id", "created_at"])
+
+
+def downgrade() -> None:
+    if _has_index("reservations", "ix_resv_buyer_created"):
+        op.drop_index("ix_resv_buyer_created", table_name="reservations")
@@ -0,0 +1,47 @@
+"""v3.7 user_notifications 복합 인덱스 보장
+
+Revision ID: f0b2d4a6c8e0
+Revises: e4a6b8c0d2f4
+Create Date: 2026-08-27 10:00:00.000000
+
+UserNotification 모델이 선언한 (user_id, is_read) / (user_id, created_at)
+인덱스는 create_all 로 만든 새 DB에만 생긴다. 대시보드 unread 카운트가
+(user_id, is_read) 필터를 타므로 기존 DB에도 멱등하게 깔아줌.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f0b2d4a6c8e0"
+down_revision: Union[str, Sequence[str], None] = "e4a6b8c0d2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("ix_notif_user_read", "user_notifications", ["user_id", "is_read"]),
+    ("ix_notif_user_created", "user_notifications", ["user_id", "created_at"]),
+]
+
+
+def _has_index(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    insp = sa.inspect(bind)
+    try:
+        return any(ix["name"] == name for ix in insp.get_indexes(table))
+    except Exception:
+        return False
+
+
+def upgrade() -> None:
+    for name, table, cols in _INDEXES:
+        if not _has_index(table, name):
+            op.create_index(name, table, cols)
+
+
+def downgrade() -> None:
+    for name, table, _cols in _INDEXES:
+        if _has_index(table, name):
+            op.drop_index(name, table_name=table)
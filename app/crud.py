@@ -1491,6 +1491,22 @@ def get_offers(db: Session, skip: int = 0, limit: int = 50):
     return db.query(models.Offer).offset(skip).limit(limit).all()
 
 
+def auto_select_best_offer(db: Session, deal_id: int):
+    """
+    ✅ checkout용 최적 Offer 선택: 잔여 수량이 있는 Offer 중 최저가 1건.
+    없으면 None.
+    """
+    return (
+        db.query(models.Offer)
+          .filter(
+              models.Offer.deal_id == deal_id,
+              models.Offer.total_available_qty > func.coalesce(models.Offer.sold_qty, 0),
+          )
+          .order_by(models.Offer.price.asc(), models.Offer.id.asc())
+          .first()
+    )
+
+
 
 # =========================================================
 # 💎 Points
@@ -1508,6 +1524,31 @@ def create_point_transaction(db: Session, transaction: schemas.PointTransactionC
     db.refresh(db_tx)
     return db_tx
 
+def log_point_transaction(
+    db: Session,
+    user_type: str,
+    user_id: int,
+    amount: int,
+    reason: str,
+    *,
+    idempotency_key: str | None = None,
+) -> PointTransaction:
+    """
+    ✅ 커밋하지 않는 포인트 로그 — ORM 객체를 돌려주므로 호출자가
+    여러 건을 모아 한 트랜잭션으로 커밋할 수 있음 (checkout 등).
+    """
+    tx = PointTransaction(
+        user_type=user_type,
+        user_id=user_id,
+        amount=amount,
+        reason=reason,
+        created_at=_utcnow(),
+        idempotency_key=idempotency_key,
+    )
+    db.add(tx)
+    return tx
+
+
 def get_point_transactions(db: Session, user_type: str, user_id: int):
     return (
         db.query(PointTransaction)
@@ -1526,6 +1567,18 @@ def get_user_balance(db: Session, user_type: str, user_id: int):
     )
     return total or 0
 
+def get_user_balances(db: Session, user_type: str, user_ids: list[int]) -> dict[int, int]:
+    """여러 유저의 포인트 잔액을 GROUP BY 한 번으로 조회 (미존재 ID는 0)."""
+    rows = (
+        db.query(PointTransaction.user_id, func.sum(PointTransaction.amount))
+          .filter(PointTransaction.user_type == user_type,
+                  PointTransaction.user_id.in_(user_ids))
+          .group_by(PointTransaction.user_id)
+          .all()
+    )
+    totals = {uid: int(total or 0) for uid, total in rows}
+    return {uid: totals.get(uid, 0) for uid in user_ids}
+
 def reward_buyer_payment(db: Session, buyer_id: int):
     return create_point_transaction(
         db,
@@ -1945,15 +1998,8 @@ def create_deal_chat_message(
 
 
 #------------------------------------
-def list_deal_chat_messages(
-    db: Session,
-    *,
-    deal_id: int,
-    buyer_id: int,
-    limit: int = 50,
-    offset: int = 0,
-    q: Optional[str] = None,
-) -> Tuple[List[DealChatMessage], int]:
+def _ensure_deal_chat_readable(db: Session, deal_id: int, buyer_id: int) -> None:
+    """딜 채팅 읽기 권한 체크 (존재/참여자/딜 상태) — 목록/export 공용."""
     # 0) 딜 존재 확인
     deal = db.get(Deal, deal_id)
     if not deal:
@@ -1979,7 +2025,19 @@ def list_deal_chat_messages(
             f"chat is closed for this deal (status={status_code})"
         )
 
-    # 3) 실제 조회
+
+def list_deal_chat_messages(
+    db: Session,
+    *,
+    deal_id: int,
+    buyer_id: int,
+    limit: int = 50,
+    offset: int = 0,
+    q: Optional[str] = None,
+) -> Tuple[List[DealChatMessage], int]:
+    _ensure_deal_chat_readable(db, deal_id, buyer_id)
+
+    # 실제 조회
     base = db.query(DealChatMessage).filter(DealChatMessage.deal_id == deal_id)
     if q:
         base = base.filter(DealChatMessage.text.ilike(f"%{q}%"))
@@ -1995,6 +2053,42 @@ def list_deal_chat_messages(
     return items, total
 
 
+def iter_deal_chat_messages(
+    db: Session,
+    *,
+    deal_id: int,
+    buyer_id: int,
+    q: Optional[str] = None,
+    chunk: int = 1000,
+):
+    """딜 채팅 전체를 id 오름차순 배치로 yield — CSV export 용.
+
+    LIMIT/OFFSET 대신 키셋(WHERE id > last_id) 페이징이라 딜이 아무리
+    커도 배치당 인덱스 스캔이 chunk 로 유지되고, 10k 건 캡도 없다.
+    권한 체크는 제너레이터를 만들기 전에 (호출 시점에) 던진다.
+    """
+    _ensure_deal_chat_readable(db, deal_id, buyer_id)
+
+    def _batches():
+        last_id = 0
+        while True:
+            base = db.query(DealChatMessage).filter(
+                DealChatMessage.deal_id == deal_id,
+                DealChatMessage.id > last_id,
+            )
+            if q:
+                base = base.filter(DealChatMessage.text.ilike(f"%{q}%"))
+            batch = base.order_by(DealChatMessage.id.asc()).limit(chunk).all()
+            if not batch:
+                return
+            yield batch
+            if len(batch) < chunk:
+                return
+            last_id = batch[-1].id
+
+    return _batches()
+
+
 
 # ============================
 #  💬 Deal Chat 접근 정책 헬퍼
@@ -2,6 +2,7 @@
 import os
 from pathlib import Path
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 def _default_sqlite_url() -> str:
@@ -32,9 +33,25 @@ if DATABASE_URL.startswith("sqlite:///"):
 
 connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
 
+# 커넥션 풀 튜닝 — 기본 pool_size=5 는 동시 요청에서 병목
+# (SQLite는 파일 기반이라 풀 설정이 의미 없음 → 서버 DB에서만 적용)
+_pool_kwargs = {}
+if not DATABASE_URL.startswith("sqlite"):
+    _pool_kwargs = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "40")),
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+    }
+
+# SQL 컴파일 캐시 크기 — 구문 종류가 많아(대시보드/집계) 기본 500이 뒤집히는 걸 방지
+_query_cache_size = int(os.environ.get("DB_QUERY_CACHE_SIZE", "1200"))
+
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
+    query_cache_size=_query_cache_size,
+    **_pool_kwargs,
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
@@ -45,4 +62,29 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ─────────────────────────────────────────────────────────────
+# ✅ Async engine/session — 읽기 위주 라우터(basic_info 등)에서 사용
+#    쿼리 대기 중에도 이벤트 루프가 다른 요청을 처리할 수 있게 함
+# ─────────────────────────────────────────────────────────────
+def _async_database_url(url: str) -> str:
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    # postgresql+psycopg 는 psycopg3 async를 그대로 지원
+    return url
+
+ASYNC_DATABASE_URL = _async_database_url(DATABASE_URL)
+
+engine_async = create_async_engine(
+    ASYNC_DATABASE_URL, query_cache_size=_query_cache_size, **_pool_kwargs
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine_async, autoflush=False, expire_on_commit=False
+)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
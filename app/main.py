@@ -316,6 +316,17 @@ _alter_cols = [
     ("offers", "product_description", "TEXT"),
     ("offers", "product_images", "TEXT"),
     ("offers", "option_agreement", "BOOLEAN DEFAULT FALSE"),
+    # v3.7: seller_rating_aggregates 레벨 캐시 컬럼 (compute_seller_level_info 결과 박제)
+    ("seller_rating_aggregates", "level", "VARCHAR(10)"),
+    ("seller_rating_aggregates", "fee_percent", "DOUBLE PRECISION"),
+    ("seller_rating_aggregates", "total_orders", "INTEGER"),
+    # v3.7: buyers 예약 카운터 (models.py Reservation 이벤트 리스너가 유지)
+    ("buyers", "resv_total_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("buyers", "resv_paid_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("buyers", "resv_cancelled_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("buyers", "resv_expired_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("buyers", "resv_paid_total_amt", "INTEGER NOT NULL DEFAULT 0"),
+    ("buyers", "resv_cancelled_total_amt", "INTEGER NOT NULL DEFAULT 0"),
 ]
 try:
     _insp = _sa.inspect(engine)
@@ -333,6 +344,33 @@ try:
                 print(f"[DB_INIT] Added column {_tbl}.{_col}", flush=True)
             except Exception as _col_err:
                 print(f"[DB_INIT] Failed to add {_tbl}.{_col}: {_col_err}", flush=True)
+        # buyers.resv_* 를 방금 추가했으면 기존 reservations 로 백필 (alembic 백필과 동일)
+        if any(_t == "buyers" and _c.startswith("resv_") for _t, _c, _ in _need_alter):
+            try:
+                with engine.begin() as _conn:
+                    _conn.execute(_sa.text("""
+                        UPDATE buyers SET
+                            resv_total_count = COALESCE((
+                                SELECT COUNT(*) FROM reservations r WHERE r.buyer_id = buyers.id), 0),
+                            resv_paid_count = COALESCE((
+                                SELECT COUNT(*) FROM reservations r
+                                WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'PAID'), 0),
+                            resv_cancelled_count = COALESCE((
+                                SELECT COUNT(*) FROM reservations r
+                                WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'CANCELLED'), 0),
+                            resv_expired_count = COALESCE((
+                                SELECT COUNT(*) FROM reservations r
+                                WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'EXPIRED'), 0),
+                            resv_paid_total_amt = COALESCE((
+                                SELECT SUM(r.amount_total) FROM reservations r
+                                WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'PAID'), 0),
+                            resv_cancelled_total_amt = COALESCE((
+                                SELECT SUM(r.amount_total) FROM reservations r
+                                WHERE r.buyer_id = buyers.id AND CAST(r.status AS TEXT) = 'CANCELLED'), 0)
+                    """))
+                print("[DB_INIT] buyers.resv_* counters backfilled", flush=True)
+            except Exception as _bf_err:
+                print(f"[DB_INIT] resv counter backfill 실패: {_bf_err}", flush=True)
     else:
         print("[DB_INIT] ALTER TABLE skipped — all columns exist", flush=True)
 except Exception as _ae:
@@ -534,6 +572,37 @@ async def start_auto_expire_worker() -> None:
     asyncio.create_task(worker())
 
 
+# --------------------------------------------------
+# buyer_dashboard_mv 주기 refresh 워커 (Postgres 전용)
+# --------------------------------------------------
+async def start_dashboard_mv_refresh_worker() -> None:
+    """
+    buyer 대시보드가 읽는 buyer_dashboard_mv 를 주기적으로
+    REFRESH MATERIALIZED VIEW CONCURRENTLY. SQLite(dev)는 MV가 없으니 안 띄움.
+    주기는 DASH_MV_REFRESH_SEC (기본 180초).
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    interval = int(os.environ.get("DASH_MV_REFRESH_SEC", "180"))
+
+    async def worker():
+        from sqlalchemy import text as _t
+        while True:
+            try:
+                def _refresh():
+                    with engine.connect() as conn:
+                        conn.execute(_t("REFRESH MATERIALIZED VIEW CONCURRENTLY buyer_dashboard_mv"))
+                        conn.commit()
+                await asyncio.to_thread(_refresh)
+            except Exception as e:
+                # 뷰 미생성(마이그레이션 전) 등 — 다음 주기에 재시도
+                print(f"[DASH_MV] refresh error: {e}")
+            await asyncio.sleep(interval)
+
+    asyncio.create_task(worker())
+
+
 # Lifespan
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -543,6 +612,23 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # ✅ 응답 캐시 초기화 (/basic/* 프로필 조회 TTL 캐시)
+    #    REDIS_URL 있으면 Redis(멀티 워커 공유), 없으면 프로세스 로컬 InMemory
+    try:
+        from fastapi_cache import FastAPICache
+        _redis_url = (os.environ.get("REDIS_URL") or "").strip()
+        if _redis_url:
+            from fastapi_cache.backends.redis import RedisBackend
+            from redis import asyncio as aioredis
+            FastAPICache.init(RedisBackend(aioredis.from_url(_redis_url)), prefix="yp")
+            print(f"✅ [lifespan] FastAPICache init (redis)")
+        else:
+            from fastapi_cache.backends.inmemory import InMemoryBackend
+            FastAPICache.init(InMemoryBackend(), prefix="yp")
+            print(f"✅ [lifespan] FastAPICache init (in-memory)")
+    except Exception as e:
+        print(f"[warn] FastAPICache init failed: {e.__class__.__name__}: {e}")
+
     # ✅ DB 테이블 생성 (module-level이 실패했을 경우 재시도)
     try:
         Base.metadata.create_all(bind=engine)
@@ -935,6 +1021,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[warn] start_auto_expire_worker failed: {e.__class__.__name__}: {e}")
 
+    try:
+        await start_dashboard_mv_refresh_worker()
+    except Exception as e:
+        print(f"[warn] start_dashboard_mv_refresh_worker failed: {e.__class__.__name__}: {e}")
+
     yield
 
     # shutdown 역할
@@ -1026,10 +1117,12 @@ _include_router_safe("auth_social", ("router",), label="auth_social")
 _include_router_safe("users", ("router",), label="users")
 
 # Buyer 기본 / 확장
-_include_router_safe("buyers", ("router",), label="buyers")
+# ⚠️ 확장 라우터를 먼저 마운트 — 기본 라우터의 GET /{buyer_id} 가 먼저 등록되면
+#    정적 경로 GET /buyers/summary 를 가로채서 buyer_id="summary" 422가 남
 _include_router_safe("routes_extended.buyers_extended", ("router",), label="routes_extended.buyers")
+_include_router_safe("buyers", ("router",), label="buyers")
 
-# Seller 기본 / 확장 / 온보딩
+# Seller 기본 / 확장 / 온보딩 (sellers_extended는 /sellers/me prefix라 충돌 없음)
 _include_router_safe("sellers", ("router",), label="sellers")
 _include_router_safe("routes_extended.sellers_extended", ("router",), label="routes_extended.sellers")
 _include_router_safe("sellers_onboarding", ("router",), label="onboarding")
@@ -1136,7 +1229,8 @@ _include_router_safe("account", ("router",), label="account")
 _include_router_safe("admin_users", ("router",), label="admin_users")
 _include_router_safe("reports", ("router",), label="reports")
 _include_router_safe("uploads", ("router",), label="uploads")
-_include_router_safe("delivery", ("router",), label="delivery")
+# delivery.py는 delivery_tracking.py와 같은 경로(GET /delivery/track, /carriers)를
+# 다시 정의하는 구버전 — 먼저 등록된 delivery_tracking에 가려져 어차피 안 탔음
 _include_router_safe("admin_anomaly", ("router",), label="admin_anomaly")
 _include_router_safe("admin_policy_proposals", ("router",), label="admin_policy_proposals")
 
@@ -54,6 +54,14 @@ class Buyer(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     points = Column(Integer, default=0, nullable=False)
     status = Column(String, default="active")
+    # v3.7: 예약 상태별 비정규화 카운터 — Reservation 이벤트 리스너(파일 하단)가
+    # 같은 트랜잭션에서 증감 유지. 대시보드 섹션3이 GROUP BY 대신 이 행을 읽는다.
+    resv_total_count = Column(Integer, default=0, nullable=False, server_default="0")
+    resv_paid_count = Column(Integer, default=0, nullable=False, server_default="0")
+    resv_cancelled_count = Column(Integer, default=0, nullable=False, server_default="0")
+    resv_expired_count = Column(Integer, default=0, nullable=False, server_default="0")
+    resv_paid_total_amt = Column(Integer, default=0, nullable=False, server_default="0")
+    resv_cancelled_total_amt = Column(Integer, default=0, nullable=False, server_default="0")
     # v3.5: 신뢰티어(누적 이행률 기반)
     trust_tier = Column(String, nullable=True)
     tier_computed_at = Column(DateTime, nullable=True)
@@ -97,6 +105,8 @@ class PointTransaction(Base):
 
     __table_args__ = (
         Index("ix_point_user_created", "user_type", "user_id", "created_at"),
+        # v3.7: 대시보드 포인트 집계(sum/count)용 — PG 에선 amount INCLUDE 로 index-only scan
+        Index("ix_point_user_dash", "user_type", "user_id", postgresql_include=["amount"]),
     )
 
 # -------------------------------------------------------
@@ -790,8 +800,16 @@ class Reservation(Base):
 
     __table_args__ = (
         Index("ix_resv_offer_status", "offer_id", "status"),
-        Index("ix_resv_buyer_status", "buyer_id", "status"),
+        # v3.7: 대시보드 집계용 커버링 — Postgres 는 INCLUDE 로 index-only scan,
+        # SQLite 는 INCLUDE 를 무시하고 기존 복합 인덱스 그대로
+        Index(
+            "ix_resv_buyer_status",
+            "buyer_id", "status",
+            postgresql_include=["amount_total", "paid_at", "shipped_at", "arrival_confirmed_at", "offer_id"],
+        ),
         Index("ix_resv_deal_status", "deal_id", "status"),
+        # v3.7: SLA 최근 N일 창 스캔용 (대시보드) — created_at 필터 푸시다운
+        Index("ix_resv_buyer_created", "buyer_id", "created_at"),
         CheckConstraint("qty > 0", name="ck_reservation_qty_positive"),
     )
 
@@ -961,6 +979,12 @@ class SellerRatingAggregate(Base):
     rating_adjusted = Column(Float, default=0.0)
     last_computed_at = Column(DateTime, nullable=True)
 
+    # v3.7: 레벨 캐시 — compute_seller_level_info 결과를 박제해
+    # 조회 경로에서 리뷰/예약 집계 없이 PK SELECT 한 번으로 읽음
+    level = Column(String(10), nullable=True)        # 예: "Lv.6"
+    fee_percent = Column(Float, nullable=True)
+    total_orders = Column(Integer, default=0)
+
     price_fairness_avg = Column(Float, default=0.0)
     quality_avg = Column(Float, default=0.0)
     shipping_avg = Column(Float, default=0.0)
@@ -2402,4 +2426,106 @@ class ClawbackRecord(Base):
     max_attempts = Column(Integer, default=3)
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    processed_at = Column(DateTime, nullable=True)
\ No newline at end of file
+    processed_at = Column(DateTime, nullable=True)
+
+# -------------------------------------------------------
+# 🔄 Buyer 예약 카운터 유지 (v3.7 대시보드 비정규화)
+#    Reservation insert/update/delete 때 buyers.resv_* 를 같은 트랜잭션에서 증감.
+#    ⚠️ query(...).update() 같은 bulk 경로는 이 이벤트를 타지 않으므로
+#    상태 전이는 ORM 객체 경유 유지할 것 (현재 crud 경로는 전부 객체 경유).
+# -------------------------------------------------------
+from sqlalchemy import event as _sa_event, inspect as _sa_inspect
+from sqlalchemy.orm import configure_mappers as _sa_configure_mappers
+
+# 상태/금액의 "변경 전" 값이 항상 history 에 남도록 강제 —
+# expire 된 객체에 바로 대입해도 이전 값을 먼저 로드해 둔다
+# (아래 after_update 리스너가 이탈 버킷 감산에 변경 전 값을 쓴다)
+_sa_configure_mappers()  # impl 은 매퍼 구성 후에야 생긴다
+Reservation.status.impl.active_history = True
+Reservation.amount_total.impl.active_history = True
+
+
+def _resv_status_name(st) -> str:
+    return st.name if hasattr(st, "name") else (str(st) if st is not None else "")
+
+
+def _resv_bucket_deltas(status_name: str, amount: int, sign: int) -> dict:
+    """상태 버킷 하나에 대한 카운트/금액 증감분 (sign=+1 진입, -1 이탈)"""
+    d: dict = {}
+    if status_name == "PAID":
+        d["resv_paid_count"] = sign
+        d["resv_paid_total_amt"] = sign * amount
+    elif status_name == "CANCELLED":
+        d["resv_cancelled_count"] = sign
+        d["resv_cancelled_total_amt"] = sign * amount
+    elif status_name == "EXPIRED":
+        d["resv_expired_count"] = sign
+    return d
+
+
+def _apply_buyer_resv_deltas(connection, buyer_id, deltas: dict) -> None:
+    deltas = {k: v for k, v in deltas.items() if v}
+    if not buyer_id or not deltas:
+        return
+    try:
+        tbl = Buyer.__table__
+        connection.execute(
+            tbl.update()
+            .where(tbl.c.id == int(buyer_id))
+            .values({k: tbl.c[k] + v for k, v in deltas.items()})
+        )
+    except Exception as _e:
+        # 카운터 유지 실패가 본 트랜잭션을 깨면 안 됨 — 대시보드는 폴백 집계 보유
+        print(f"[RESV_COUNTER] buyer={buyer_id} update 실패: {_e}", flush=True)
+
+
+@_sa_event.listens_for(Reservation, "after_insert")
+def _resv_counters_after_insert(mapper, connection, target):
+    amt = int(getattr(target, "amount_total", 0) or 0)
+    d = {"resv_total_count": 1}
+    d.update(_resv_bucket_deltas(_resv_status_name(target.status), amt, +1))
+    _apply_buyer_resv_deltas(connection, getattr(target, "buyer_id", None), d)
+
+
+@_sa_event.listens_for(Reservation, "after_update")
+def _resv_counters_after_update(mapper, connection, target):
+    try:
+        attrs = _sa_inspect(target).attrs
+        st_hist = attrs.status.history
+        amt_hist = attrs.amount_total.history
+    except Exception:
+        return
+
+    new_amt = int(getattr(target, "amount_total", 0) or 0)
+    # 같은 flush에서 금액도 바뀌었으면 이탈(-1) 쪽은 변경 전 금액으로 빼야 함
+    old_amt = new_amt
+    if amt_hist.has_changes() and amt_hist.deleted:
+        old_amt = int(amt_hist.deleted[0] or 0)
+
+    d: dict = {}
+    if st_hist.has_changes():
+        old = st_hist.deleted[0] if st_hist.deleted else None
+        new = st_hist.added[0] if st_hist.added else target.status
+        for k, v in _resv_bucket_deltas(_resv_status_name(old), old_amt, -1).items():
+            d[k] = d.get(k, 0) + v
+        for k, v in _resv_bucket_deltas(_resv_status_name(new), new_amt, +1).items():
+            d[k] = d.get(k, 0) + v
+    elif new_amt != old_amt:
+        # 상태는 그대로, 금액만 바뀐 경우 — 현재 버킷의 금액 합만 보정
+        name = _resv_status_name(target.status)
+        if name == "PAID":
+            d["resv_paid_total_amt"] = new_amt - old_amt
+        elif name == "CANCELLED":
+            d["resv_cancelled_total_amt"] = new_amt - old_amt
+
+    if not d:
+        return
+    _apply_buyer_resv_deltas(connection, getattr(target, "buyer_id", None), d)
+
+
+@_sa_event.listens_for(Reservation, "after_delete")
+def _resv_counters_after_delete(mapper, connection, target):
+    amt = int(getattr(target, "amount_total", 0) or 0)
+    d = {"resv_total_count": -1}
+    d.update(_resv_bucket_deltas(_resv_status_name(target.status), amt, -1))
+    _apply_buyer_resv_deltas(connection, getattr(target, "buyer_id", None), d)
@@ -13,9 +13,12 @@ S1(딜 생성) / S2(Target 변경) / S3(Anchor 도착)에서
 
 from __future__ import annotations
 
+from functools import lru_cache
+import dataclasses
 from typing import Optional, Any, Dict, List
 from pathlib import Path
 from datetime import datetime, timezone
+import os
 
 from sqlalchemy.orm import Session
 
@@ -78,6 +81,40 @@ def _get_guardrail_params() -> Optional[Dict[str, Any]]:
 # ------------------------------------------------------------
 # A) 평가 함수
 # ------------------------------------------------------------
+@lru_cache(maxsize=int(os.environ.get("GUARDRAIL_EVAL_CACHE_SIZE", "4096")))
+def _evaluate_cached(
+    category: str | None,
+    target_price: float | None,
+    anchor_price: float | None,
+    evidence_score: int,
+    anchor_confidence: float,
+):
+    """evaluate_target_vs_anchor 메모이제이션.
+
+    level/reason_codes/ui/ops 는 (category, target, anchor, evidence,
+    confidence) + pricing.yaml 로 결정된다 — deal_id 는 입력 dataclass에
+    있을 뿐 평가에 쓰이지 않는다. 단 metrics.now_ts 는 평가 시각이라
+    호출마다 달라야 하므로 캐시 히트 시 run_pricing_guardrail 쪽에서
+    새로 찍는다 (여기 캐시된 값은 최초 평가 시각).
+    같은 카테고리/앵커 구간의 딜이 반복될 때 재평가를 건너뛴다.
+    pricing.yaml 을 바꿨으면 _evaluate_cached.cache_clear() (params 로더도
+    프로세스 수명 캐시라 어차피 재시작이 기본).
+    """
+    params = _get_guardrail_params() or {}
+
+    inp = PriceAxisEvaluationInput(
+        deal_id=0,
+        category=category,
+        target_price=target_price,
+        anchor_price=anchor_price,
+        evidence_score=evidence_score,
+        anchor_confidence=anchor_confidence,
+        now_ts=datetime.now(timezone.utc),
+    )
+
+    return evaluate_target_vs_anchor(params, inp)
+
+
 def run_pricing_guardrail(
     *,
     deal_id: int,
@@ -88,19 +125,23 @@ def run_pricing_guardrail(
     anchor_confidence: float | None = 1.0,
     stage: str | None = None,   # ✅ 추가
 ):
-    params = _get_guardrail_params() or {}
-
-    inp = PriceAxisEvaluationInput(
-        deal_id=int(deal_id),
-        category=category,
-        target_price=float(target_price) if target_price is not None else None,
-        anchor_price=float(anchor_price) if anchor_price is not None else None,
-        evidence_score=int(evidence_score or 0),
-        anchor_confidence=float(anchor_confidence or 1.0),
-        now_ts=datetime.now(timezone.utc),
+    result = _evaluate_cached(
+        category,
+        float(target_price) if target_price is not None else None,
+        float(anchor_price) if anchor_price is not None else None,
+        int(evidence_score or 0),
+        float(anchor_confidence or 1.0),
     )
 
-    result = evaluate_target_vs_anchor(params, inp)
+    # ✅ metrics.now_ts 는 evidence pack에 그대로 적히는 평가 시각 —
+    # 캐시 히트여도 이번 호출 시각이 남도록 result 사본에 새로 찍는다
+    # (캐시에 들어있는 원본 dict 는 건드리지 않는다)
+    metrics = getattr(result, "metrics", None)
+    if isinstance(metrics, dict) and "now_ts" in metrics:
+        result = dataclasses.replace(
+            result,
+            metrics={**metrics, "now_ts": datetime.now(timezone.utc).isoformat()},
+        )
 
     # ✅ stage는 result에 얹어서 downstream(log/preview)에서 사용 가능하게
     try:
@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
+import json
+import re
 from typing import Annotated, Dict, Any, Optional
 from datetime import time
 
 from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi.responses import Response
 
 from app.config import time_policy, project_rules as R  # <- deposit 정책은 project_rules에 존재
 
@@ -21,6 +24,21 @@ router = APIRouter(prefix="/admin/policy", tags=["🛠 Admin • Policy Control
 
 
 # 내부 유틸
+# HH:MM[:SS] — 범위(00-23 / 00-59)까지 정규식이 보장하므로 별도 bounds 체크 불필요
+# (분/초는 기존 int 파서처럼 한 자리도 허용: "5:7" → 05:07)
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]?\d)(?::([0-5]?\d))?$")
+
+# /status 응답 캐시 — 정책 변경 시 버전이 올라가며 무효화됨
+# (TIME_POLICY/DEAD_TIME_POLICY는 이 라우터에서만 변경됨)
+_POLICY_VERSION = 0
+_status_cache: Optional[tuple[int, bytes]] = None
+
+
+def _bump_policy_version() -> None:
+    global _POLICY_VERSION
+    _POLICY_VERSION += 1
+
+
 def _deadtime_to_str(v: Any) -> str:
     if isinstance(v, bool):
         return "true" if v else "false"
@@ -36,16 +54,18 @@ def _parse_deadtime_value(value: str) -> Any:
       - "HH:MM" 또는 "HH:MM:SS"         → datetime.time
       - 그 외                          → 원문 문자열
     """
-    lo = value.strip().lower()
+    stripped = value.strip()
+    lo = stripped.lower()
     if lo in ("true", "false"):
         return lo == "true"
-    # HH:MM[:SS]
-    parts = value.split(":")
+    # HH:MM[:SS] — 정규식 fast-path (split/isdigit 루프 제거)
+    m = _TIME_RE.match(stripped)
+    if m:
+        return time(int(m[1]), int(m[2]), int(m[3] or 0))
+    # 숫자:숫자 모양인데 범위를 벗어난 경우(예: "25:00")는 기존처럼 400
+    parts = stripped.split(":")
     if len(parts) in (2, 3) and all(p.isdigit() for p in parts):
-        h = int(parts[0]); m = int(parts[1]); s = int(parts[2]) if len(parts) == 3 else 0
-        if not (0 <= h <= 23 and 0 <= m <= 59 and 0 <= s <= 59):
-            raise HTTPException(status_code=400, detail="invalid time value (expect HH:MM or HH:MM:SS)")
-        return time(hour=h, minute=m, second=s)
+        raise HTTPException(status_code=400, detail="invalid time value (expect HH:MM or HH:MM:SS)")
     return value
 
 
@@ -68,13 +88,20 @@ def _require_deadtime_key(key: str) -> None:
     description="개발용: 인증 없이 현재 TIME_POLICY/DEAD_TIME_POLICY를 조회합니다.",
 )
 def get_current_policies():
+    global _status_cache
+    if _status_cache is not None and _status_cache[0] == _POLICY_VERSION:
+        return Response(content=_status_cache[1], media_type="application/json")
+
     # 문자열 직렬화(DeadTime)로 가독성 향상
     dead = {k: _deadtime_to_str(v) for k, v in time_policy.DEAD_TIME_POLICY.items()}
-    return {
+    payload = {
         "TIME_POLICY": dict(time_policy.TIME_POLICY),
         "DEAD_TIME_POLICY": dead,
         "verified_admin": "dev (no-auth)",
     }
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    _status_cache = (_POLICY_VERSION, body)
+    return Response(content=body, media_type="application/json")
 
 
 # -------------------------------------------------------
@@ -104,6 +131,7 @@ def update_time_policy(
 
     old_value = time_policy.TIME_POLICY[key]
     time_policy.TIME_POLICY[key] = float(hours)
+    _bump_policy_version()
 
     return {
         "message": f"{key} updated successfully",
@@ -143,6 +171,7 @@ def update_deadtime_policy(
     old_value = time_policy.DEAD_TIME_POLICY[key]
     parsed_value = _parse_deadtime_value(value)
     time_policy.DEAD_TIME_POLICY[key] = parsed_value
+    _bump_policy_version()
 
     return {
         "message": f"DeadTime '{key}' updated successfully",
@@ -195,6 +224,9 @@ def bulk_update_policies(
         time_policy.DEAD_TIME_POLICY[k] = parsed
         changed_dead[k] = {"old": _deadtime_to_str(old), "new": _deadtime_to_str(parsed)}
 
+    if changed_time or changed_dead:
+        _bump_policy_version()
+
     return {
         "message": "bulk update successful",
         "changed_time": changed_time,
@@ -214,6 +246,7 @@ def bulk_update_policies(
 def reset_policies():
     if hasattr(time_policy, "reset_to_default"):
         time_policy.reset_to_default()
+        _bump_policy_version()
         dead = {k: _deadtime_to_str(v) for k, v in time_policy.DEAD_TIME_POLICY.items()}
         return {
             "message": "All policies have been reset to default values (dev).",
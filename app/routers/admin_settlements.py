@@ -4,11 +4,19 @@ from __future__ import annotations
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Header, Path, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, load_only
 
 from app.database import get_db
 from app import models, schemas
 
+# 응답 스키마에 포함되는 컬럼만 SELECT — 넓은 정산 row의 과다 로딩 방지
+_SETTLEMENT_OUT_COLS = tuple(
+    getattr(models.ReservationSettlement, name)
+    for name in schemas.ReservationSettlementOut.model_fields
+    if hasattr(models.ReservationSettlement, name)  # order_number 등 파생 필드 제외
+)
+
 router = APIRouter(
     prefix="/admin/settlements",
     tags=["admin_settlements"],
@@ -133,7 +141,6 @@ def api_admin_approve_settlement(
 # ---------------------------------------------------------
 @router.get(
     "/by_reservation/{reservation_id}",
-    response_model=schemas.ReservationSettlementOut,
     summary="[ADMIN] 특정 예약(reservation_id)의 정산 레코드 조회",
 )
 def api_get_settlement_by_reservation(
@@ -142,6 +149,7 @@ def api_get_settlement_by_reservation(
 ):
     row = (
         db.query(models.ReservationSettlement)
+        .options(load_only(*_SETTLEMENT_OUT_COLS))
         .filter(models.ReservationSettlement.reservation_id == reservation_id)
         .first()
     )
@@ -152,4 +160,6 @@ def api_get_settlement_by_reservation(
             detail="Settlement not found for this reservation_id",
         )
 
-    return row
+    # response_model 재검증/jsonable_encoder 경유 없이 1회 검증 + orjson 인코딩
+    out = schemas.ReservationSettlementOut.model_validate(row, from_attributes=True)
+    return ORJSONResponse(out.model_dump())
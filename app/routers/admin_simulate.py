@@ -3,28 +3,51 @@
 # Version: v3.4-fullflow-api
 # ✅ FastAPI에서 DB 초기화 + 샘플 데이터 생성 + 시뮬레이션 실행용 API
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import List, Dict, Any
+import logging
 import os
-import traceback
 
 from app.database import get_db, engine
 from app import models, schemas, crud
 from app.config.feature_flags import FEATURE_FLAGS
 
-from simulation_fullflow_v3_7 import run   # ✅ 여기서 v3_4 → v3_5 로 변경
+# ⚠️ simulation_fullflow_v3_7은 분석 파이프라인(pandas/matplotlib)을 끌고 오므로
+#    워커 기동 비용을 줄이기 위해 run_simulation 내부에서 lazy import
+
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin/simulate", tags=["simulate"])
 
+# meta 블록의 고정 부분은 import 시점에 1회만 구성
+_STATIC_META: Dict[str, Any] = {
+    "version": "v3.4-fullflow-api",
+    "feature_flags": FEATURE_FLAGS,
+}
+
+_db_url_cache: Dict[int, str] = {}
+
+
+def _cached_db_url(db: Session) -> str | None:
+    """URL.__str__() 재호출을 피하기 위해 bind별로 문자열을 메모이즈."""
+    bind = db.bind
+    if bind is None:
+        return None
+    key = id(bind)
+    url = _db_url_cache.get(key)
+    if url is None:
+        url = _db_url_cache[key] = str(bind.url)
+    return url
+
 
 # -----------------------------------------------------
 # 🧨 내부 함수: DB 전체 리셋
 # -----------------------------------------------------
 def _reset_db() -> None:
-    print("🧨 RESET_DB → 모든 테이블 드롭 후 재생성")
+    log.info("🧨 RESET_DB → 모든 테이블 드롭 후 재생성")
     models.Base.metadata.drop_all(bind=engine)
     models.Base.metadata.create_all(bind=engine)
 
@@ -44,34 +67,42 @@ def simulate_fullflow(
         if reset_db:
             _reset_db()
 
-        # ---- 샘플 Buyers ----
-        buyer_ids, buyer_emails = [], []
-        for i in range(5):
-            email = f"buyer{i}_auto@test.com"
-            buyer = crud.create_buyer(db, schemas.BuyerCreate(
-                email=email, name=f"Buyer {i}", password="pass1234"
-            ))
-            buyer_ids.append(buyer.id)
-            buyer_emails.append(email)
+        # ---- 샘플 Buyers (단건 crud 호출 대신 bulk INSERT … RETURNING) ----
+        # 동일 비밀번호이므로 bcrypt 해시는 1회만 계산
+        from sqlalchemy import insert
+
+        hashed_pw = crud.bcrypt_hash_password("pass1234")
+        now = datetime.utcnow()
+
+        buyer_emails = [f"buyer{i}_auto@test.com" for i in range(5)]
+        buyer_ids = list(db.execute(
+            insert(models.Buyer).returning(models.Buyer.id),
+            [
+                {"email": email, "name": f"Buyer {i}", "password_hash": hashed_pw, "created_at": now}
+                for i, email in enumerate(buyer_emails)
+            ],
+        ).scalars())
 
         # ---- 샘플 Sellers ----
-        seller_ids, seller_emails = [], []
-        for i in range(4):
-            email = f"seller{i}_auto@test.com"
-
-            # ✅ SellerCreate 스키마 필수필드 채우기 (phone/address/zip_code/established_date)
-            seller = crud.create_seller(db, schemas.SellerCreate(
-                email=email,
-                password="pass1234",
-                business_name=f"Biz {i}",
-                business_number=f"100-00-000{i}",
-                phone=f"010-9000-000{i}",
-                address=f"Seoul Test-ro {i}",
-                zip_code="00000",
-                established_date=datetime.utcnow(),
-            ))
-            seller_ids.append(seller.id)
-            seller_emails.append(email)
+        seller_emails = [f"seller{i}_auto@test.com" for i in range(4)]
+        seller_ids = list(db.execute(
+            insert(models.Seller).returning(models.Seller.id),
+            [
+                {
+                    "email": email,
+                    "password_hash": hashed_pw,
+                    "business_name": f"Biz {i}",
+                    "business_number": f"100-00-000{i}",
+                    "phone": f"010-9000-000{i}",
+                    "address": f"Seoul Test-ro {i}",
+                    "zip_code": "00000",
+                    "established_date": now,
+                    "created_at": now,
+                }
+                for i, email in enumerate(seller_emails)
+            ],
+        ).scalars())
+        db.commit()
 
         # ---- Deal A ----
         deal_a = crud.create_deal(db, schemas.DealCreate(
@@ -84,34 +115,35 @@ def simulate_fullflow(
         crud.add_participant(db, schemas.DealParticipantCreate(deal_id=deal_a.id, buyer_id=buyer_ids[1], qty=1))
         crud.add_participant(db, schemas.DealParticipantCreate(deal_id=deal_a.id, buyer_id=buyer_ids[2], qty=2))
 
-        offer_a1 = crud.create_offer(db, schemas.OfferCreate(
-            deal_id=deal_a.id,
-            seller_id=seller_ids[1],
-            price=1000.0,
-            total_available_qty=10,
-            free_text="A1",
-            shipping_mode="PER_RESERVATION",
-            shipping_fee_per_reservation=0,
-            shipping_fee_per_qty=0,
-        ))
-
-        offer_a2 = crud.create_offer(db, schemas.OfferCreate(
-            deal_id=deal_a.id,
-            seller_id=seller_ids[2],
-            price=1100.0,
-            total_available_qty=5,
-            free_text="A2",
-            shipping_mode="PER_RESERVATION",
-            shipping_fee_per_reservation=0,
-            shipping_fee_per_qty=0,
-        ))
+        def _offer_row(deal_id: int, seller_id: int, price: float, qty: int, comment: str) -> Dict[str, Any]:
+            # 시뮬레이션 고정 데이터용 bulk INSERT row (create_offer의 기본 정책과 동일)
+            return {
+                "deal_id": deal_id,
+                "seller_id": seller_id,
+                "price": price,
+                "total_available_qty": qty,
+                "comment": comment,
+                "shipping_mode": "PER_RESERVATION",
+                "shipping_fee_per_reservation": 0,
+                "shipping_fee_per_qty": 0,
+                "created_at": now,
+            }
+
+        offer_a1_id, offer_a2_id = db.execute(
+            insert(models.Offer).returning(models.Offer.id),
+            [
+                _offer_row(deal_a.id, seller_ids[1], 1000.0, 10, "A1"),
+                _offer_row(deal_a.id, seller_ids[2], 1100.0, 5, "A2"),
+            ],
+        ).scalars()
 
+        offer_a1 = db.get(models.Offer, offer_a1_id)
         offer_a1.sold_qty = offer_a1.total_available_qty
-        db.commit(); db.refresh(offer_a1)
+        db.commit()
 
         crud.reward_buyer_payment(db, buyer_id=buyer_ids[1])       # +20
         crud.penalize_buyer_cancel(db, buyer_id=buyer_ids[2])      # -20
-        crud.confirm_offer_and_reward(db, offer_id=offer_a1.id)    # +30
+        crud.confirm_offer_and_reward(db, offer_id=offer_a1_id)    # +30
         crud.penalize_seller_cancel_offer(db, seller_id=seller_ids[2])  # -30
 
         # ---- Deal B ----
@@ -122,31 +154,14 @@ def simulate_fullflow(
             target_price=1000.0,        # ✅ 예시(원하는 값으로)
         ))
 
-        offer_b1 = crud.create_offer(db, schemas.OfferCreate(
-            deal_id=deal_b.id,
-            seller_id=seller_ids[1],
-            price=200.0,
-            total_available_qty=3,
-            free_text="B1",
-
-            # ✅ 중요: NONE 금지 → 유효 enum으로 명시
-            shipping_mode="PER_RESERVATION",
-            shipping_fee_per_reservation=0,
-            shipping_fee_per_qty=0,
-        ))
-
-        offer_b2 = crud.create_offer(db, schemas.OfferCreate(
-            deal_id=deal_b.id,
-            seller_id=seller_ids[2],
-            price=210.0,
-            total_available_qty=2,
-            free_text="B2",
-
-            # ✅ 중요: NONE 금지 → 유효 enum으로 명시
-            shipping_mode="PER_RESERVATION",
-            shipping_fee_per_reservation=0,
-            shipping_fee_per_qty=0,
-        ))
+        offer_b1_id, offer_b2_id = db.execute(
+            insert(models.Offer).returning(models.Offer.id),
+            [
+                _offer_row(deal_b.id, seller_ids[1], 200.0, 3, "B1"),
+                _offer_row(deal_b.id, seller_ids[2], 210.0, 2, "B2"),
+            ],
+        ).scalars()
+        db.commit()
 
 
         # ---- Deal C ----
@@ -160,17 +175,16 @@ def simulate_fullflow(
         _ = crud.add_participant(db, schemas.DealParticipantCreate(deal_id=deal_c.id, buyer_id=buyer_ids[1], qty=10))
         crud.remove_participant(db, participant_id=p1.id)  # -20
 
-        # ---- 포인트 요약 ----
-        buyers_balance = {str(bid): crud.get_user_balance(db, "buyer", bid) for bid in buyer_ids}
-        sellers_balance = {str(sid): crud.get_user_balance(db, "seller", sid) for sid in seller_ids}
+        # ---- 포인트 요약 (유저당 1쿼리 → user_type당 1쿼리) ----
+        buyers_balance = {str(bid): bal for bid, bal in crud.get_user_balances(db, "buyer", buyer_ids).items()}
+        sellers_balance = {str(sid): bal for sid, bal in crud.get_user_balances(db, "seller", seller_ids).items()}
 
         return {
             "meta": {
+                **_STATIC_META,
                 "started_at": datetime.utcnow().isoformat(),
                 "reset_db": reset_db,
-                "version": "v3.4-fullflow-api",
-                "db": str(db.bind.url) if db.bind else None,
-                "feature_flags": FEATURE_FLAGS,
+                "db": _cached_db_url(db),
             },
             "buyers": buyer_emails,
             "sellers": seller_emails,
@@ -180,8 +194,8 @@ def simulate_fullflow(
                 {"id": deal_c.id, "product_name": deal_c.product_name},
             ],
             "offers": {
-                "deal_a": [offer_a1.id, offer_a2.id],
-                "deal_b": [offer_b1.id, offer_b2.id],
+                "deal_a": [offer_a1_id, offer_a2_id],
+                "deal_b": [offer_b1_id, offer_b2_id],
             },
             "point_balances": {
                 "buyers": buyers_balance,
@@ -190,9 +204,8 @@ def simulate_fullflow(
         }
 
     except Exception as e:
-        tb = traceback.format_exc()
-        print("❌ simulate_fullflow failed:", repr(e))
-        print(tb)
+        # log.exception이 traceback을 같이 남김 (format_exc 문자열 빌드 불필요)
+        log.exception("❌ simulate_fullflow failed")
         # ✅ 이제 curl에서 detail로 원인이 바로 보이게
         raise HTTPException(status_code=500, detail=f"{e.__class__.__name__}: {e}")
 
@@ -201,7 +214,7 @@ def simulate_fullflow(
 # 📊 최신 분석 그래프 조회
 # -----------------------------------------------------
 @router.get("/analysis/latest", response_class=FileResponse)
-def get_latest_analysis_chart(chart_type: str = "buyer_points"):
+def get_latest_analysis_chart(request: Request, chart_type: str = "buyer_points"):
     """
     최근 분석 그래프 반환 (buyer_points / seller_points / deal_participants_offers)
     """
@@ -209,12 +222,32 @@ def get_latest_analysis_chart(chart_type: str = "buyer_points"):
     if not os.path.exists(output_dir):
         raise HTTPException(status_code=404, detail="No analysis results found")
 
-    files = sorted([f for f in os.listdir(output_dir) if chart_type in f], reverse=True)
-    if not files:
+    # 단일 패스 max-by-mtime (파일명 정렬은 생성 순서와 다를 수 있음)
+    latest_file, latest_mtime = None, -1.0
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if chart_type in entry.name and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_file, latest_mtime = entry.path, mtime
+
+    if latest_file is None:
         raise HTTPException(status_code=404, detail=f"No chart for type '{chart_type}'")
 
-    latest_file = os.path.join(output_dir, files[0])
-    return FileResponse(latest_file, media_type="image/png")
+    # mtime+size 기반 ETag — FileResponse는 If-None-Match를 직접 처리하지
+    # 않으므로(StaticFiles만 해줌) 여기서 비교해서 304를 돌려준다
+    st = os.stat(latest_file)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": "public, max-age=60"},
+        )
+    return FileResponse(
+        latest_file,
+        media_type="image/png",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=60"},
+    )
 
 # -----------------------------------------------------
 # 📊 Summary
@@ -257,5 +290,6 @@ def run_simulation(db: Session = Depends(get_db)):
     """
     🔁 DB 리셋 후 전체 시뮬레이션 실행
     """
+    from simulation_fullflow_v3_7 import run
     result = run()
     return {"message": "Simulation complete", "result": result}
\ No newline at end of file
@@ -1,5 +1,6 @@
 # app/routers/admin_simulate_status.py
 from fastapi import APIRouter, Depends
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app import models
@@ -8,27 +9,45 @@ router = APIRouter(prefix="/admin/simulate", tags=["admin", "simulate"])
 
 @router.get("/status", summary="시뮬레이션/DB 상태 요약")
 def simulate_status(db: Session = Depends(get_db)):
-    deals = db.query(models.Deal).all()
-    offers = db.query(models.Offer).all()
+    # 요약에 쓰는 컬럼만 Row 튜플로 선택 — ORM 객체 hydration 비용 제거
+    deals = db.query(
+        models.Deal.id,
+        models.Deal.product_name,
+        models.Deal.status,
+        models.Deal.created_at,
+        models.Deal.deadline_at,
+    ).all()
+    offers_total = db.query(func.count(models.Offer.id)).scalar() or 0
 
-    deal_summaries = []
-    for d in deals:
-        participants = db.query(models.DealParticipant).filter(models.DealParticipant.deal_id == d.id).count()
-        off = db.query(models.Offer).filter(models.Offer.deal_id == d.id).count()
-        deal_summaries.append({
-            "deal_id": d.id,
-            "product_name": d.product_name,
-            "participants": participants,
-            "offers": off,
-            "status": getattr(d, "status", "open"),
-            "created_at": d.created_at.isoformat() if d.created_at else None,
-            "deadline_at": d.deadline_at.isoformat() if getattr(d, "deadline_at", None) else None
-        })
+    # deal별 집계를 GROUP BY 두 번으로 미리 뽑아 N+1 COUNT 쿼리 제거
+    part_counts = dict(
+        db.query(models.DealParticipant.deal_id, func.count())
+        .group_by(models.DealParticipant.deal_id)
+        .all()
+    )
+    offer_counts = dict(
+        db.query(models.Offer.deal_id, func.count())
+        .group_by(models.Offer.deal_id)
+        .all()
+    )
+
+    deal_summaries = [
+        {
+            "deal_id": deal_id,
+            "product_name": product_name,
+            "participants": part_counts.get(deal_id, 0),
+            "offers": offer_counts.get(deal_id, 0),
+            "status": status or "open",
+            "created_at": created_at and created_at.isoformat(),
+            "deadline_at": deadline_at and deadline_at.isoformat(),
+        }
+        for deal_id, product_name, status, created_at, deadline_at in deals
+    ]
 
     return {
         "totals": {
             "deals": len(deals),
-            "offers": len(offers),
+            "offers": offers_total,
         },
         "deal_summaries": deal_summaries
-    }
\ No newline at end of file
+    }
@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
+from sqlalchemy import literal, null, select, union_all
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 from .. import database, models
@@ -52,44 +53,41 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     """
     email = form_data.username.strip().lower()
     pw = form_data.password
-    user = None
-    role = ""
-    extra_claims: dict = {}
-
-    # 1. User(관리자) 테이블
-    u = db.query(models.User).filter(models.User.email == email).first()
-    if u and verify_password(pw, u.hashed_password):
-        user, role = u, getattr(u, "role", "admin")
-
-    # 2. Buyer
-    if not user:
-        b = db.query(models.Buyer).filter(models.Buyer.email == email).first()
-        if b and verify_password(pw, b.password_hash):
-            user, role = b, "buyer"
-
-    # 3. Seller (승인 여부와 무관하게 로그인 허용, 오퍼 제출만 제한)
-    if not user:
-        s = db.query(models.Seller).filter(models.Seller.email == email).first()
-        if s and verify_password(pw, s.password_hash):
-            user, role = s, "seller"
-            extra_claims["seller_id"] = s.id
-            extra_claims["verified"] = bool(s.verified_at)
 
-    # 4. Actuator
-    if not user:
-        a = db.query(models.Actuator).filter(
-            models.Actuator.email == email
-        ).first()
-        if a and verify_password(pw, a.password_hash):
-            user, role = a, "actuator"
-            extra_claims["actuator_id"] = a.id
+    # 4개 테이블을 UNION ALL 한 방으로 조회 (라운드트립 4회 → 1회)
+    # rank 컬럼으로 기존 우선순위(User → Buyer → Seller → Actuator) 유지
+    stmt = union_all(
+        select(literal(0).label("rank"), models.User.id, models.User.hashed_password,
+               models.User.role, null()).where(models.User.email == email),
+        select(literal(1), models.Buyer.id, models.Buyer.password_hash,
+               literal("buyer"), null()).where(models.Buyer.email == email),
+        select(literal(2), models.Seller.id, models.Seller.password_hash,
+               literal("seller"), models.Seller.verified_at).where(models.Seller.email == email),
+        select(literal(3), models.Actuator.id, models.Actuator.password_hash,
+               literal("actuator"), null()).where(models.Actuator.email == email),
+    )
+    rows = sorted(db.execute(stmt).all(), key=lambda r: r[0])
 
-    if not user:
+    user_id = None
+    role = ""
+    extra_claims: dict = {}
+    for _rank, uid, hashed, row_role, verified_at in rows:
+        if hashed and verify_password(pw, hashed):
+            user_id, role = uid, (row_role or "admin")
+            if row_role == "seller":
+                # 승인 여부와 무관하게 로그인 허용, 오퍼 제출만 제한
+                extra_claims["seller_id"] = uid
+                extra_claims["verified"] = bool(verified_at)
+            elif row_role == "actuator":
+                extra_claims["actuator_id"] = uid
+            break
+
+    if user_id is None:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
 
     # JWT 토큰 발급
     access_token = create_access_token(
-        data={"sub": str(user.id), "role": role, **extra_claims},
+        data={"sub": str(user_id), "role": role, **extra_claims},
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     )
     return {"access_token": access_token, "token_type": "bearer"}
@@ -1,15 +1,26 @@
 # app/routers/basic_info.py
 from __future__ import annotations
-from typing import Optional, List, Any, Mapping
+import asyncio
+import os
+from operator import attrgetter
+from typing import Optional, List, Any, Mapping, Union
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Depends, Query, Path, Request
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from pydantic import BaseModel
-from sqlalchemy import MetaData, Table, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy import MetaData, Table, bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 
-from app.database import get_db
-from app.routers.reviews import compute_seller_level_info, SellerLevelOut
+from app.database import get_async_db
+from app.routers.reviews import (
+    compute_seller_level_info,
+    compute_seller_level_info_bulk,
+    SellerLevelOut,
+)
 
 
 # 가능한 경우 ORM 모델 사용
@@ -55,294 +66,515 @@ class SellerBasicOut(BaseModel):
         from_attributes = True
 
 
+# keyset(cursor) 페이지 응답 — cursor 쿼리 파라미터를 준 경우에만 사용
+class BuyerPageOut(BaseModel):
+    items: List[BuyerBasicOut]
+    next_cursor: Optional[int] = None
+
+class SellerPageOut(BaseModel):
+    items: List[SellerBasicOut]
+    next_cursor: Optional[int] = None
+
+
+# ---------------- response cache ----------------
+# 프로필 카드 조회는 순수 read-only → 짧은 TTL 캐시로 반복 조회 시 DB를 아예 안 탐
+# (백엔드는 main.py lifespan에서 FastAPICache.init — REDIS_URL 있으면 Redis, 없으면 InMemory)
+_BASIC_CACHE_NS = "basic"
+_BASIC_CACHE_TTL = int(os.environ.get("BASIC_CACHE_TTL", "30"))
+
+
+def _basic_cache_key(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    # 기본 key_builder는 kwargs 전체(repr)를 키에 넣어서 AsyncSession 객체가 섞이면
+    # 요청마다 키가 달라져 영원히 miss → path/query 스칼라만 골라 키를 만든다
+    params = sorted(
+        (k, v) for k, v in (kwargs or {}).items()
+        if v is None or isinstance(v, (int, str, float, bool))
+    )
+    return f"{namespace}:{func.__name__}:{params}"
+
+
+def invalidate_basic_cache() -> None:
+    """Buyer/Seller 쓰기 경로에서 호출 — /basic/* 응답 캐시를 즉시 비움 (best-effort)."""
+    try:
+        coro = FastAPICache.clear(namespace=_BASIC_CACHE_NS)
+        try:
+            asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # sync 라우트(threadpool)에서 호출된 경우 — 이 스레드에는 루프가 없음
+            asyncio.run(coro)
+    except Exception:
+        # 캐시 미초기화(테스트 등)나 백엔드 오류는 TTL 만료에 맡김
+        pass
+
+
 # ---------------- helpers ----------------
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
+def _req_now(request: Request) -> datetime:
+    """요청당 1회만 시계를 읽음 — placeholder 응답용 (같은 요청 안에서 값이 흔들리지 않게)."""
+    now = getattr(request.state, "now_utc", None)
+    if now is None:
+        now = request.state.now_utc = _now_utc()
+    return now
+
+# 행 dict의 키 집합은 fetcher 경로별로 고정(ORM이면 6개 고정 키, 리플렉션이면 테이블 컬럼).
+# 행마다 `m.get(a) or m.get(b) or ...` 체인을 다시 타는 대신, 키 집합당 한 번만
+# 실제 존재하는 컬럼명을 골라 model_construct 기반 전용 매퍼를 만들어 재사용한다.
+
+def _pick_key(keys: frozenset, *names: str) -> Optional[str]:
+    for n in names:
+        if n in keys:
+            return n
+    return None
+
+def _make_buyer_mapper(keys: frozenset):
+    k_id = _pick_key(keys, "id", "buyer_id")
+    k_name = _pick_key(keys, "name", "full_name", "display_name", "username")
+    k_email = _pick_key(keys, "email", "email_address")
+    k_phone = _pick_key(keys, "phone", "phone_number", "mobile", "tel")
+    k_addr = _pick_key(keys, "address", "addr", "shipping_address")
+    k_created = _pick_key(keys, "created_at", "joined_at", "createdAt")
+
+    def mapper(m: Mapping[str, Any]) -> BuyerBasicOut:
+        # DB에서 온 신뢰 데이터 → model_construct로 validation 생략
+        return BuyerBasicOut.model_construct(
+            buyer_id=int(m[k_id]),
+            name=m[k_name] if k_name else None,
+            email=m[k_email] if k_email else None,
+            phone=m[k_phone] if k_phone else None,
+            address=m[k_addr] if k_addr else None,
+            created_at=m[k_created] if k_created else None,
+        )
+    return mapper
+
+def _make_seller_mapper(keys: frozenset):
+    k_id = _pick_key(keys, "id", "seller_id")
+    k_name = _pick_key(keys, "name", "company_name")
+    k_company = _pick_key(keys, "company_name")
+    k_email = _pick_key(keys, "email")
+    k_phone = _pick_key(keys, "phone")
+    k_addr = _pick_key(keys, "address")
+    k_created = _pick_key(keys, "created_at")
+
+    def mapper(m: Mapping[str, Any]) -> SellerBasicOut:
+        return SellerBasicOut.model_construct(
+            seller_id=int(m[k_id]),
+            name=m[k_name] if k_name else None,
+            company_name=m[k_company] if k_company else None,
+            email=m[k_email] if k_email else None,
+            phone=m[k_phone] if k_phone else None,
+            address=m[k_addr] if k_addr else None,
+            created_at=m[k_created] if k_created else None,
+        )
+    return mapper
+
+_buyer_mappers: dict[frozenset, Any] = {}
+_seller_mappers: dict[frozenset, Any] = {}
+
 def _buyer_from_mapping(m: Mapping[str, Any]) -> BuyerBasicOut:
-    return BuyerBasicOut(
-        buyer_id=int(m.get("id") or m.get("buyer_id")),
-        name=(
-            m.get("name")
-            or m.get("full_name")
-            or m.get("display_name")
-            or m.get("username")
-        ),
-        email=m.get("email") or m.get("email_address"),
-        phone=m.get("phone") or m.get("phone_number") or m.get("mobile") or m.get("tel"),
-        address=m.get("address") or m.get("addr") or m.get("shipping_address"),
-        created_at=m.get("created_at") or m.get("joined_at") or m.get("createdAt"),
-    )
+    keys = frozenset(m.keys())
+    mapper = _buyer_mappers.get(keys)
+    if mapper is None:
+        mapper = _buyer_mappers[keys] = _make_buyer_mapper(keys)
+    return mapper(m)
 
 def _seller_from_mapping(m: Mapping[str, Any]) -> SellerBasicOut:
-    sid = int(m.get("id") or m.get("seller_id"))
-    nm = m.get("name") or m.get("company_name")
-    return SellerBasicOut(
-        seller_id=sid,
-        name=nm,
-        company_name=m.get("company_name"),
-        email=m.get("email"),
-        phone=m.get("phone"),
-        address=m.get("address"),
-        created_at=m.get("created_at"),
-    )
+    keys = frozenset(m.keys())
+    mapper = _seller_mappers.get(keys)
+    if mapper is None:
+        mapper = _seller_mappers[keys] = _make_seller_mapper(keys)
+    return mapper(m)
+
+# 스키마는 정적이므로 리플렉션 결과를 bind별로 캐시 (요청당 INFORMATION_SCHEMA 왕복 제거)
+_reflected_tables: dict[tuple[str, tuple[str, ...]], Optional[Table]] = {}
 
 def _reflect_table(db: Session, names: List[str]) -> Optional[Table]:
-    md = MetaData()
     bind = db.get_bind()
+    key = (str(bind.url), tuple(names))
+    if key in _reflected_tables:
+        return _reflected_tables[key]
+
+    md = MetaData()
+    t: Optional[Table] = None
     for n in names:
         try:
-            return Table(n, md, autoload_with=bind)
+            t = Table(n, md, autoload_with=bind)
+            break
         except Exception:
             continue
-    return None
+    _reflected_tables[key] = t
+    return t
 
 
-# ---------------- fetchers (ORM → reflect → raw SQL) ----------------
-def _fetch_buyer_row(db: Session, buyer_id: int) -> Optional[Mapping[str, Any]]:
-    # 1) ORM
-    if BuyerModel is not None:
-        try:
-            pk = getattr(BuyerModel, "id", None) or getattr(BuyerModel, "buyer_id", None)
-            if pk is not None:
-                row = db.query(BuyerModel).filter(pk == buyer_id).first()
-                if row is not None:
-                    return {
-                        "id": getattr(row, "id", getattr(row, "buyer_id", None)),
-                        "name": getattr(row, "name", None),
-                        "email": getattr(row, "email", None),
-                        "phone": getattr(row, "phone", None),
-                        "address": getattr(row, "address", None),
-                        "created_at": getattr(row, "created_at", None),
-                    }
-        except Exception:
-            pass
+# ---------------- fetchers (import 시점에 경로 특화) ----------------
+# ORM 모델 import 성공 여부는 프로세스 수명 동안 불변이므로,
+# 요청마다 ORM → reflect → raw SQL 케스케이드를 try/except로 타는 대신
+# 여기서 한 번 판단해 전용 구현을 바인딩한다.
 
-    # 2) 리플렉션
-    t = _reflect_table(db, ["buyers", "buyer"])
-    if t is not None:
-        try:
+if BuyerModel is not None and SellerModel is not None:
+    # select()를 요청마다 다시 조립하지 않도록 bindparam으로 1회 구성.
+    # 목록은 응답에 노출되는 컬럼만 로드 — password_hash 등 넓은 컬럼은 안 읽음
+    _BUYER_BASIC_LOAD = load_only(
+        BuyerModel.id, BuyerModel.name, BuyerModel.email,
+        BuyerModel.phone, BuyerModel.address, BuyerModel.created_at,
+    )
+    _SELLER_BASIC_LOAD = load_only(
+        SellerModel.id, SellerModel.email, SellerModel.phone,
+        SellerModel.address, SellerModel.created_at,
+    )
+    _BUYER_ROW_STMT = select(BuyerModel).where(BuyerModel.id == bindparam("pk"))
+    _BUYER_LIST_STMT = (
+        select(BuyerModel)
+        .options(_BUYER_BASIC_LOAD)
+        .order_by(BuyerModel.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("skip"))
+    )
+    _SELLER_ROW_STMT = select(SellerModel).where(SellerModel.id == bindparam("pk"))
+    _SELLER_LIST_STMT = (
+        select(SellerModel)
+        .options(_SELLER_BASIC_LOAD)
+        .order_by(SellerModel.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("skip"))
+    )
+    # keyset(seek) 변형 — OFFSET은 skip행을 읽고 버리므로 깊은 페이지에서 O(skip),
+    # WHERE id < cursor 는 PK 인덱스로 O(limit)
+    _BUYER_KEYSET_STMT = (
+        select(BuyerModel)
+        .options(_BUYER_BASIC_LOAD)
+        .where(BuyerModel.id < bindparam("cursor"))
+        .order_by(BuyerModel.id.desc())
+        .limit(bindparam("limit"))
+    )
+    _SELLER_KEYSET_STMT = (
+        select(SellerModel)
+        .options(_SELLER_BASIC_LOAD)
+        .where(SellerModel.id < bindparam("cursor"))
+        .order_by(SellerModel.id.desc())
+        .limit(bindparam("limit"))
+    )
+
+    # 행 루프에서 default 있는 getattr(AttributeError 캐치)를 반복하지 않도록
+    # attrgetter를 1회 바인딩. 모델에 없는 컬럼(name 등)은 import 시점에 판정.
+    _BUYER_GETTER = attrgetter("id", "name", "email", "phone", "address", "created_at")
+    _SELLER_GETTER = attrgetter("id", "email", "phone", "address", "created_at")
+    _SELLER_HAS_NAME = hasattr(SellerModel, "name")
+    _SELLER_HAS_COMPANY = hasattr(SellerModel, "company_name")
+
+    async def _fetch_buyer_row(db: AsyncSession, buyer_id: int) -> Optional[Mapping[str, Any]]:
+        row = (await db.execute(_BUYER_ROW_STMT, {"pk": buyer_id})).scalars().first()
+        if row is None:
+            return None
+        bid, nm, em, ph, ad, ca = _BUYER_GETTER(row)
+        return {"id": bid, "name": nm, "email": em, "phone": ph, "address": ad, "created_at": ca}
+
+    async def _fetch_buyer_list(
+        db: AsyncSession, skip: int, limit: int, cursor: Optional[int] = None
+    ) -> List[Mapping[str, Any]]:
+        if cursor is not None:
+            result = await db.execute(_BUYER_KEYSET_STMT, {"cursor": cursor, "limit": limit})
+        else:
+            result = await db.execute(_BUYER_LIST_STMT, {"limit": limit, "skip": skip})
+        rows = result.scalars().all()
+        g = _BUYER_GETTER
+        out: List[Mapping[str, Any]] = []
+        for r in rows:
+            bid, nm, em, ph, ad, ca = g(r)
+            out.append({"id": bid, "name": nm, "email": em, "phone": ph, "address": ad, "created_at": ca})
+        return out
+
+    def _seller_row_dict(r: Any) -> Mapping[str, Any]:
+        sid, em, ph, ad, ca = _SELLER_GETTER(r)
+        return {
+            "id": sid,
+            "name": r.name if _SELLER_HAS_NAME else None,
+            "company_name": r.company_name if _SELLER_HAS_COMPANY else None,
+            "email": em,
+            "phone": ph,
+            "address": ad,
+            "created_at": ca,
+        }
+
+    async def _fetch_seller_row(db: AsyncSession, seller_id: int) -> Optional[Mapping[str, Any]]:
+        row = (await db.execute(_SELLER_ROW_STMT, {"pk": seller_id})).scalars().first()
+        if row is None:
+            return None
+        return _seller_row_dict(row)
+
+    async def _fetch_seller_list(
+        db: AsyncSession, skip: int, limit: int, cursor: Optional[int] = None
+    ) -> List[Mapping[str, Any]]:
+        if cursor is not None:
+            result = await db.execute(_SELLER_KEYSET_STMT, {"cursor": cursor, "limit": limit})
+        else:
+            result = await db.execute(_SELLER_LIST_STMT, {"limit": limit, "skip": skip})
+        rows = result.scalars().all()
+        return [_seller_row_dict(r) for r in rows]
+
+else:
+    # ORM 모델을 못 가져온 환경에서만 쓰는 리플렉션/raw SQL 폴백
+
+    # 응답에 노출될 가능성이 있는 컬럼 후보 (매퍼의 fallback 이름과 동일)
+    _BUYER_EXPOSED = (
+        "id", "buyer_id", "name", "full_name", "display_name", "username",
+        "email", "email_address", "phone", "phone_number", "mobile", "tel",
+        "address", "addr", "shipping_address", "created_at", "joined_at", "createdAt",
+    )
+    _SELLER_EXPOSED = (
+        "id", "seller_id", "name", "company_name",
+        "email", "phone", "address", "created_at",
+    )
+
+    def _narrow_select(t: Table, exposed: tuple) -> Any:
+        # SELECT * 대신 노출 컬럼만 — 넓은 컬럼(해시/블롭)을 와이어에서 제거
+        cols = [c for c in t.c if c.name in exposed]
+        return select(*cols) if cols else select(t)
+
+    # raw SQL 폴백의 (테이블, PK) 조합은 스키마가 고정이므로 첫 성공을 메모.
+    # 메모 전에는 최대 4콤보 × ProgrammingError 캐치를 돌지만, 이후엔 1쿼리.
+    _BUYER_PROBE: Optional[tuple] = None
+    _SELLER_PROBE: Optional[tuple] = None
+
+    async def _fetch_buyer_row(db: AsyncSession, buyer_id: int) -> Optional[Mapping[str, Any]]:
+        # 리플렉션 (autoload는 sync 전용 → run_sync로 우회)
+        t = await db.run_sync(lambda s: _reflect_table(s, ["buyers", "buyer"]))
+        if t is not None:
             col = t.c.get("id") or t.c.get("buyer_id")
             if col is not None:
-                r = db.execute(select(t).where(col == buyer_id)).mappings().first()
+                r = (await db.execute(select(t).where(col == buyer_id))).mappings().first()
                 if r:
                     return r
-        except Exception:
-            pass
 
-    # 3) 원시 SQL 폴백
-    for tbl in ("buyers", "buyer"):
-        for pk in ("id", "buyer_id"):
+        # 원시 SQL 폴백 — 성공한 (테이블, PK) 조합을 메모해 다음부터 바로 조회
+        global _BUYER_PROBE
+        if _BUYER_PROBE is not None:
+            tbl, pk = _BUYER_PROBE
             try:
                 sql = text(f"SELECT * FROM {tbl} WHERE {pk} = :bid LIMIT 1")
-                r = db.execute(sql, {"bid": buyer_id}).mappings().first()
+                return (await db.execute(sql, {"bid": buyer_id})).mappings().first()
+            except Exception:
+                _BUYER_PROBE = None  # 스키마가 바뀐 드문 경우 — 재탐색
+
+        probe = None
+        for tbl in ("buyers", "buyer"):
+            for pk in ("id", "buyer_id"):
+                try:
+                    sql = text(f"SELECT * FROM {tbl} WHERE {pk} = :bid LIMIT 1")
+                    r = (await db.execute(sql, {"bid": buyer_id})).mappings().first()
+                except Exception:
+                    continue
+                if probe is None:
+                    probe = (tbl, pk)  # 에러 없이 실행된 첫 조합
                 if r:
+                    _BUYER_PROBE = (tbl, pk)
                     return r
-            except Exception:
-                continue
-    return None
-
-def _fetch_buyer_list(db: Session, skip: int, limit: int) -> List[Mapping[str, Any]]:
-    out: List[Mapping[str, Any]] = []
-
-    if BuyerModel is not None:
-        try:
-            id_col = getattr(BuyerModel, "id", None) or getattr(BuyerModel, "buyer_id", None)
-            q = db.query(BuyerModel)
-            if id_col is not None:
-                q = q.order_by(id_col.desc())
-            rows = q.offset(skip).limit(limit).all()
-            for r in rows:
-                out.append({
-                    "id": getattr(r, "id", getattr(r, "buyer_id", None)),
-                    "name": getattr(r, "name", None),
-                    "email": getattr(r, "email", None),
-                    "phone": getattr(r, "phone", None),
-                    "address": getattr(r, "address", None),
-                    "created_at": getattr(r, "created_at", None),
-                })
-            if out:
-                return out
-        except Exception:
-            out = []
-
-    t = _reflect_table(db, ["buyers", "buyer"])
-    if t is not None:
-        try:
+        _BUYER_PROBE = probe
+        return None
+
+    async def _fetch_buyer_list(
+        db: AsyncSession, skip: int, limit: int, cursor: Optional[int] = None
+    ) -> List[Mapping[str, Any]]:
+        t = await db.run_sync(lambda s: _reflect_table(s, ["buyers", "buyer"]))
+        if t is not None:
             id_col = t.c.get("id") or t.c.get("buyer_id")
-            stmt = select(t)
+            stmt = _narrow_select(t, _BUYER_EXPOSED)
             if id_col is not None:
                 stmt = stmt.order_by(id_col.desc())
-            rows = db.execute(stmt.offset(skip).limit(limit)).mappings().all()
+                if cursor is not None:
+                    # keyset — OFFSET 없이 PK 인덱스로 다음 페이지 seek
+                    rows = (await db.execute(stmt.where(id_col < cursor).limit(limit))).mappings().all()
+                    return list(rows)
+            rows = (await db.execute(stmt.offset(skip).limit(limit))).mappings().all()
             return list(rows)
-        except Exception:
-            pass
-
-    # 원시 SQL 리스트 폴백
-    for tbl in ("buyers", "buyer"):
-        try:
-            sql = text(f"SELECT * FROM {tbl} ORDER BY id DESC LIMIT :limit OFFSET :skip")
-            rows = db.execute(sql, {"limit": limit, "skip": skip}).mappings().all()
-            if rows:
-                return list(rows)
-        except Exception:
-            continue
-    return []
 
-def _fetch_seller_row(db: Session, seller_id: int) -> Optional[Mapping[str, Any]]:
-    if SellerModel is not None:
-        try:
-            pk = getattr(SellerModel, "id", None) or getattr(SellerModel, "seller_id", None)
-            if pk is not None:
-                row = db.query(SellerModel).filter(pk == seller_id).first()
-                if row is not None:
-                    return {
-                        "id": getattr(row, "id", getattr(row, "seller_id", None)),
-                        "name": getattr(row, "name", None),
-                        "company_name": getattr(row, "company_name", None),
-                        "email": getattr(row, "email", None),
-                        "phone": getattr(row, "phone", None),
-                        "address": getattr(row, "address", None),
-                        "created_at": getattr(row, "created_at", None),
-                    }
-        except Exception:
-            pass
+        for tbl in ("buyers", "buyer"):
+            try:
+                if cursor is not None:
+                    sql = text(f"SELECT * FROM {tbl} WHERE id < :cursor ORDER BY id DESC LIMIT :limit")
+                    rows = (await db.execute(sql, {"cursor": cursor, "limit": limit})).mappings().all()
+                else:
+                    sql = text(f"SELECT * FROM {tbl} ORDER BY id DESC LIMIT :limit OFFSET :skip")
+                    rows = (await db.execute(sql, {"limit": limit, "skip": skip})).mappings().all()
+                if rows:
+                    return list(rows)
+            except Exception:
+                continue
+        return []
 
-    t = _reflect_table(db, ["sellers", "seller"])
-    if t is not None:
-        try:
+    async def _fetch_seller_row(db: AsyncSession, seller_id: int) -> Optional[Mapping[str, Any]]:
+        t = await db.run_sync(lambda s: _reflect_table(s, ["sellers", "seller"]))
+        if t is not None:
             col = t.c.get("id") or t.c.get("seller_id")
             if col is not None:
-                r = db.execute(select(t).where(col == seller_id)).mappings().first()
+                r = (await db.execute(select(t).where(col == seller_id))).mappings().first()
                 if r:
                     return r
-        except Exception:
-            pass
 
-    for tbl in ("sellers", "seller"):
-        for pk in ("id", "seller_id"):
+        global _SELLER_PROBE
+        if _SELLER_PROBE is not None:
+            tbl, pk = _SELLER_PROBE
             try:
                 sql = text(f"SELECT * FROM {tbl} WHERE {pk} = :sid LIMIT 1")
-                r = db.execute(sql, {"sid": seller_id}).mappings().first()
+                return (await db.execute(sql, {"sid": seller_id})).mappings().first()
+            except Exception:
+                _SELLER_PROBE = None  # 스키마가 바뀐 드문 경우 — 재탐색
+
+        probe = None
+        for tbl in ("sellers", "seller"):
+            for pk in ("id", "seller_id"):
+                try:
+                    sql = text(f"SELECT * FROM {tbl} WHERE {pk} = :sid LIMIT 1")
+                    r = (await db.execute(sql, {"sid": seller_id})).mappings().first()
+                except Exception:
+                    continue
+                if probe is None:
+                    probe = (tbl, pk)  # 에러 없이 실행된 첫 조합
                 if r:
+                    _SELLER_PROBE = (tbl, pk)
                     return r
-            except Exception:
-                continue
-    return None
-
-def _fetch_seller_list(db: Session, skip: int, limit: int) -> List[Mapping[str, Any]]:
-    out: List[Mapping[str, Any]] = []
-
-    if SellerModel is not None:
-        try:
-            id_col = getattr(SellerModel, "id", None) or getattr(SellerModel, "seller_id", None)
-            q = db.query(SellerModel)
-            if id_col is not None:
-                q = q.order_by(id_col.desc())
-            rows = q.offset(skip).limit(limit).all()
-            for r in rows:
-                out.append({
-                    "id": getattr(r, "id", getattr(r, "seller_id", None)),
-                    "name": getattr(r, "name", None),
-                    "company_name": getattr(r, "company_name", None),
-                    "email": getattr(r, "email", None),
-                    "phone": getattr(r, "phone", None),
-                    "address": getattr(r, "address", None),
-                    "created_at": getattr(r, "created_at", None),
-                })
-            if out:
-                return out
-        except Exception:
-            out = []
-
-    t = _reflect_table(db, ["sellers", "seller"])
-    if t is not None:
-        try:
+        _SELLER_PROBE = probe
+        return None
+
+    async def _fetch_seller_list(
+        db: AsyncSession, skip: int, limit: int, cursor: Optional[int] = None
+    ) -> List[Mapping[str, Any]]:
+        t = await db.run_sync(lambda s: _reflect_table(s, ["sellers", "seller"]))
+        if t is not None:
             id_col = t.c.get("id") or t.c.get("seller_id")
-            stmt = select(t)
+            stmt = _narrow_select(t, _SELLER_EXPOSED)
             if id_col is not None:
                 stmt = stmt.order_by(id_col.desc())
-            rows = db.execute(stmt.offset(skip).limit(limit)).mappings().all()
+                if cursor is not None:
+                    rows = (await db.execute(stmt.where(id_col < cursor).limit(limit))).mappings().all()
+                    return list(rows)
+            rows = (await db.execute(stmt.offset(skip).limit(limit))).mappings().all()
             return list(rows)
-        except Exception:
-            pass
 
-    for tbl in ("sellers", "seller"):
-        try:
-            sql = text(f"SELECT * FROM {tbl} ORDER BY id DESC LIMIT :limit OFFSET :skip")
-            rows = db.execute(sql, {"limit": limit, "skip": skip}).mappings().all()
-            if rows:
-                return list(rows)
-        except Exception:
-            continue
-    return []
+        for tbl in ("sellers", "seller"):
+            try:
+                if cursor is not None:
+                    sql = text(f"SELECT * FROM {tbl} WHERE id < :cursor ORDER BY id DESC LIMIT :limit")
+                    rows = (await db.execute(sql, {"cursor": cursor, "limit": limit})).mappings().all()
+                else:
+                    sql = text(f"SELECT * FROM {tbl} ORDER BY id DESC LIMIT :limit OFFSET :skip")
+                    rows = (await db.execute(sql, {"limit": limit, "skip": skip})).mappings().all()
+                if rows:
+                    return list(rows)
+            except Exception:
+                continue
+        return []
 
 
 # ---------------- routes (이제 /basic/* 만 사용) ----------------
 
 @router.get("/basic/buyers/{buyer_id}", response_model=BuyerBasicOut)
-def get_buyer(
+@cache(expire=_BASIC_CACHE_TTL, namespace=_BASIC_CACHE_NS, key_builder=_basic_cache_key)
+async def get_buyer(
+    request: Request,
     buyer_id: int = Path(..., ge=1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    m = _fetch_buyer_row(db, buyer_id)
+    m = await _fetch_buyer_row(db, buyer_id)
     if m:
         return _buyer_from_mapping(m)
-    return BuyerBasicOut(
+    # 고정 리터럴 기본값 → validation 불필요
+    return BuyerBasicOut.model_construct(
         buyer_id=buyer_id,
         name=f"Buyer #{buyer_id}",
-        created_at=_now_utc(),
+        created_at=_req_now(request),
     )
 
 
-@router.get("/basic/buyers/", response_model=List[BuyerBasicOut])
-def list_buyers(
+# 목록 응답(최대 100행 + datetime)은 stdlib json 대비 orjson이 수 배 빠름
+@router.get(
+    "/basic/buyers/",
+    response_model=Union[List[BuyerBasicOut], BuyerPageOut],
+    response_class=ORJSONResponse,
+)
+@cache(expire=_BASIC_CACHE_TTL, namespace=_BASIC_CACHE_NS, key_builder=_basic_cache_key)
+async def list_buyers(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[int] = Query(None, ge=1, description="마지막으로 본 buyer_id — 주면 keyset 페이지네이션"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    rows = _fetch_buyer_list(db, skip, limit)
-    return [_buyer_from_mapping(r) for r in rows]
+    rows = await _fetch_buyer_list(db, skip, limit, cursor)
+    outs = [_buyer_from_mapping(r) for r in rows]
+    if cursor is None:
+        # 구버전 호환 — cursor 없이 호출하면 기존 리스트 그대로
+        return outs
+    next_cursor = outs[-1].buyer_id if len(outs) == limit else None
+    return BuyerPageOut.model_construct(items=outs, next_cursor=next_cursor)
 
 
 @router.get("/basic/sellers/{seller_id}", response_model=SellerBasicOut)
-def get_seller(
+@cache(expire=_BASIC_CACHE_TTL, namespace=_BASIC_CACHE_NS, key_builder=_basic_cache_key)
+async def get_seller(
+    request: Request,
     seller_id: int = Path(..., ge=1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    m = _fetch_seller_row(db, seller_id)
+    m = await _fetch_seller_row(db, seller_id)
     if m:
         # 기본 프로필 정보
         base = _seller_from_mapping(m)  # SellerBasicOut 인스턴스
 
         try:
-            lvl = compute_seller_level_info(db, seller_id)
-            # Pydantic v1/v2 모두 dict() 는 동작
-            data = base.dict()
-            data.update(
-                level=lvl.level,
-                fee_percent=lvl.fee_percent,
-                rating_adjusted=lvl.rating_adjusted,
-                rating_count=lvl.rating_count,
-                total_orders=lvl.total_orders,
-            )
-            return SellerBasicOut(**data)
+            lvl = await db.run_sync(lambda s: compute_seller_level_info(s, seller_id))
+            # dict() 덤프 + 재검증 없이 필드만 갱신한 사본 반환
+            return base.model_copy(update={
+                "level": lvl.level,
+                "fee_percent": lvl.fee_percent,
+                "rating_adjusted": lvl.rating_adjusted,
+                "rating_count": lvl.rating_count,
+                "total_orders": lvl.total_orders,
+            })
         except Exception:
             # 리뷰/레벨 계산에 문제가 나도 기본 정보는 그대로 반환
             return base
 
-    # seller row 자체가 없을 때 기본값
-    return SellerBasicOut(
+    # seller row 자체가 없을 때 기본값 (고정 리터럴 → validation 불필요)
+    return SellerBasicOut.model_construct(
         seller_id=seller_id,
         name=f"Seller #{seller_id}",
-        created_at=_now_utc(),
+        created_at=_req_now(request),
     )
 
-@router.get("/basic/sellers/", response_model=List[SellerBasicOut])
-def list_sellers(
+@router.get(
+    "/basic/sellers/",
+    response_model=Union[List[SellerBasicOut], SellerPageOut],
+    response_class=ORJSONResponse,
+)
+@cache(expire=_BASIC_CACHE_TTL, namespace=_BASIC_CACHE_NS, key_builder=_basic_cache_key)
+async def list_sellers(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[int] = Query(None, ge=1, description="마지막으로 본 seller_id — 주면 keyset 페이지네이션"),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    rows = _fetch_seller_list(db, skip, limit)
-    return [_seller_from_mapping(r) for r in rows]
\ No newline at end of file
+    rows = await _fetch_seller_list(db, skip, limit, cursor)
+    outs = [_seller_from_mapping(r) for r in rows]
+
+    # 레벨/수수료 enrichment — bulk 헬퍼 1회 호출 (TTL 메모 공유, N+1 방지)
+    try:
+        ids = [o.seller_id for o in outs]
+        levels = await db.run_sync(lambda s: compute_seller_level_info_bulk(s, ids))
+        for o in outs:
+            lvl = levels.get(o.seller_id)
+            if lvl is not None:
+                o.level = lvl.level
+                o.fee_percent = lvl.fee_percent
+                o.rating_adjusted = lvl.rating_adjusted
+                o.rating_count = lvl.rating_count
+                o.total_orders = lvl.total_orders
+    except Exception:
+        # 레벨 계산 실패 시 기본 정보만 반환 (get_seller와 동일한 방어)
+        pass
+
+    if cursor is None:
+        # 구버전 호환 — cursor 없이 호출하면 기존 리스트 그대로
+        return outs
+    next_cursor = outs[-1].seller_id if len(outs) == limit else None
+    return SellerPageOut.model_construct(items=outs, next_cursor=next_cursor)
\ No newline at end of file
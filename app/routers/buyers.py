@@ -4,6 +4,7 @@
 # Date: 2025-11-07
 
 from fastapi import APIRouter, HTTPException, Depends, Path
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -80,7 +81,10 @@ def create_buyer(
     db: Session = Depends(database.get_db),
 ):
     try:
-        return crud.create_buyer(db, buyer)
+        created = crud.create_buyer(db, buyer)
+        from app.routers.basic_info import invalidate_basic_cache
+        invalidate_basic_cache()  # /basic/buyers/ 목록 캐시 갱신
+        return created
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="Email already exists")
@@ -159,6 +163,9 @@ def update_buyer(
     db.commit()
     db.refresh(buyer)
 
+    from app.routers.basic_info import invalidate_basic_cache
+    invalidate_basic_cache()  # /basic/buyers/* 캐시에 이전 프로필이 남지 않게
+
     return {
         "id": buyer.id,
         "email": buyer.email,
@@ -187,6 +194,19 @@ class BuyerBasicOut(BaseModel):
     created_at: Optional[datetime] = None
 
 
+# 포털 카드는 읽기 전용 → ORM 인스턴스 하이드레이션(identity map/이벤트) 없이
+# Core 컬럼 튜플로 바로 응답을 만든다. select는 import 시점에 1회 조립.
+_GET_BUYER_BASIC_STMT = select(
+    models.Buyer.id,
+    models.Buyer.name,
+    models.Buyer.nickname,
+    models.Buyer.email,
+    models.Buyer.phone,
+    models.Buyer.address,
+    models.Buyer.created_at,
+).where(models.Buyer.id == bindparam("bid"))
+
+
 @router.get("/{buyer_id}", response_model=BuyerBasicOut)
 def get_buyer_basic(
     buyer_id: int = Path(..., ge=1),
@@ -197,17 +217,18 @@ def get_buyer_basic(
     - 기본값은 buyers 테이블(models.Buyer)의 값
     - 못 찾으면 예전처럼 "Buyer #id" 로 표기
     """
-    row = db.query(models.Buyer).get(buyer_id)
+    row = db.execute(_GET_BUYER_BASIC_STMT, {"bid": buyer_id}).one_or_none()
 
     if row:
-        return BuyerBasicOut(
-            buyer_id=row.id,
-            name=row.name,
-            nickname=getattr(row, "nickname", None),
-            email=row.email,
-            phone=row.phone,
-            address=row.address,
-            created_at=row.created_at,
+        bid, name, nickname, email, phone, address, created_at = row
+        return BuyerBasicOut.model_construct(
+            buyer_id=bid,
+            name=name,
+            nickname=nickname,
+            email=email,
+            phone=phone,
+            address=address,
+            created_at=created_at,
         )
 
     # DB에 없을 때만 최소 정보 표기 (구버전 호환)
@@ -9,12 +9,20 @@ router = APIRouter(prefix="/checkout", tags=["checkout"])
 
 @router.post("/checkout/{deal_id}")
 def checkout_deal(deal_id: int, buyer_id: int, db: Session = Depends(get_db)):
-    deal = db.query(models.Deal).get(deal_id)
+    # db.get은 identity map을 먼저 보고, 이미 로드된 세션이면 SQL 자체를 생략
+    deal = db.get(models.Deal, deal_id)
     if not deal:
         raise HTTPException(404, "Deal not found")
     best_offer = crud.auto_select_best_offer(db, deal_id)
     if not best_offer:
         raise HTTPException(400, "No offers yet")
+
+    # 포인트 로그 2건을 한 트랜잭션으로 — 부분 기록으로 장부가 어긋나지 않게
     crud.log_point_transaction(db, "buyer", buyer_id, -best_offer.price, "deal checkout")
     crud.log_point_transaction(db, "seller", best_offer.seller_id, best_offer.price, "deal sold")
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     return {"message": "Checkout complete", "deal_id": deal_id}
\ No newline at end of file
@@ -7,11 +7,11 @@ import re
 import urllib.parse
 from typing import List, Optional
 
-from fastapi import APIRouter, Body, File, HTTPException, Depends, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Body, File, HTTPException, Depends, UploadFile
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app import crud
 from app.llm_client import get_client
 
@@ -202,12 +202,17 @@ normalized_free_text: 사용자 설명을 한두 문장으로 정리. 없으면
 """.strip()
 
 
+# 코드펜스 제거용 패턴 — 응답마다 re.sub 가 재컴파일하지 않게 모듈에서 한 번만
+_FENCE_JSON_RE = re.compile(r"^```json", re.IGNORECASE)
+_FENCE_RE = re.compile(r"^```")
+
+
 def _parse_json_safely(text: str) -> dict:
     """LLM이 ```json ... ``` 형태로 줄 때를 대비한 파싱 유틸."""
     raw = text.strip()
     if raw.startswith("```"):
-        raw = re.sub(r"^```json", "", raw, flags=re.IGNORECASE).strip()
-        raw = re.sub(r"^```", "", raw).strip()
+        raw = _FENCE_JSON_RE.sub("", raw).strip()
+        raw = _FENCE_RE.sub("", raw).strip()
         if raw.endswith("```"):
             raw = raw[:-3].strip()
     # 그래도 실패하면 첫 { ~ 마지막 } 추출
@@ -810,8 +815,25 @@ def _run_ai_deal_helper(raw_title: str, raw_free_text: str) -> DealAIResponse:
 # 메인 엔드포인트
 # ─────────────────────────────────────────────
 
+def _log_ai_event_bg(endpoint: str, request: dict, response: dict | None) -> None:
+    """AI 이벤트 로그 — BackgroundTasks 에서 응답 이후 실행 (요청 세션과 분리)."""
+    db = SessionLocal()
+    try:
+        crud.log_ai_event(
+            db,
+            endpoint=endpoint,
+            buyer_id=None,
+            request=request,
+            response=response,
+            deal_id=None,
+        )
+    finally:
+        db.close()
+
+
 @router.post("", response_model=DealAIResponse)
 def ai_deal_helper(
+    background_tasks: BackgroundTasks,
     body: DealAIRequest = Body(...),
     db: Session = Depends(get_db),
 ):
@@ -896,14 +918,12 @@ def ai_deal_helper(
 
         result = _run_ai_deal_helper(raw_title, raw_ft)
 
-        # ── 로그 ─────────────────────────────────────────────
-        crud.log_ai_event(
-            db,
-            endpoint="ai/deal_helper",
-            buyer_id=None,
-            request=body.model_dump(mode="json"),
-            response=result.model_dump(mode="json"),
-            deal_id=None,
+        # ── 로그 — 응답에 필요 없으므로 응답 경로 밖(BackgroundTasks)에서 ──
+        background_tasks.add_task(
+            _log_ai_event_bg,
+            "ai/deal_helper",
+            body.model_dump(mode="json"),
+            result.model_dump(mode="json"),
         )
 
         return result
@@ -1,18 +1,20 @@
 # app/routers/deal_chat.py
 from __future__ import annotations
 
-from datetime import datetime
-from io import StringIO
-import csv
+from datetime import datetime, timezone
+import json
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from .. import models, crud
-from app.routers.notifications import create_notification
+from app.routers.notifications import _send_fcm_for_user
 
 router = APIRouter(
     prefix="/deals",
@@ -75,6 +77,126 @@ def _make_display_name(db: Session, buyer_id: int) -> str:
     return f"buyer-{buyer_id}"
 
 
+def _make_display_name_map(db: Session, buyer_ids) -> dict:
+    """buyer_id → 표시 이름을 IN(...) 한 방으로.
+
+    메시지 목록처럼 같은 buyer 가 반복되는 루프에서 건별 db.get() N+1 을 없앤다.
+    이름 규칙은 _make_display_name 과 동일 (nickname 우선, 없으면 buyer-{id}).
+    """
+    ids = {int(b) for b in buyer_ids if b}
+    names = {bid: f"buyer-{bid}" for bid in ids}
+    if not ids:
+        return names
+    try:
+        rows = (
+            db.query(models.Buyer.id, models.Buyer.nickname)
+            .filter(models.Buyer.id.in_(ids))
+            .all()
+        )
+        for bid, nick in rows:
+            if nick:
+                names[bid] = nick
+    except Exception:
+        # 조회 실패 시 fallback 가명 유지 — 목록 자체는 깨지지 않게
+        pass
+    return names
+
+
+def _csv_quote(s: str) -> str:
+    """고정 스키마 export 용 최소 CSV 인용.
+
+    csv.writer 기본 동작과 동일하게 구분자/따옴표/개행이 들어있을 때만
+    따옴표로 감싼다 (내부 따옴표는 "" 로 이스케이프).
+    """
+    if '"' in s:
+        return '"' + s.replace('"', '""') + '"'
+    if "," in s or "\r" in s or "\n" in s:
+        return '"' + s + '"'
+    return s
+
+
+# BOM + 헤더는 요청마다 다시 만들 필요가 없는 상수 바이트
+_EXPORT_BOM_HEADER = (
+    b"\xef\xbb\xbf"
+    b"id,deal_id,buyer_id,sender_nickname,text,blocked,blocked_reason,created_at\r\n"
+)
+
+
+def _fanout_deal_chat_notifications(
+    deal_id: int,
+    msg_id: int,
+    sender_buyer_id: int,
+    sender_nickname: str,
+    snippet: str,
+) -> None:
+    """딜 채팅 알림 fanout — BackgroundTasks 에서 응답 이후 실행.
+
+    요청 세션과 분리된 세션을 새로 연다.
+    실패해도 채팅 작성 자체에는 영향이 없어야 하므로 로그만 남긴다.
+    """
+    db = SessionLocal()
+    try:
+        # 필요한 건 buyer_id 뿐 — 전체 DealParticipant ORM 행 hydration 생략
+        # (자기 자신 제외는 WHERE 로 내려보냄)
+        target_ids = [
+            int(bid)
+            for (bid,) in db.query(models.DealParticipant.buyer_id)
+            .filter(
+                models.DealParticipant.deal_id == deal_id,
+                models.DealParticipant.buyer_id != sender_buyer_id,
+            )
+            .all()
+            if bid
+        ]
+        if not target_ids:
+            return
+
+        now = datetime.now(timezone.utc)
+        title = f"딜 #{deal_id} 새 채팅 메시지"
+        message = f"{sender_nickname}: {snippet}"
+        meta = {
+            "role": "buyer",
+            "deal_id": deal_id,
+            "sender_buyer_id": sender_buyer_id,
+            "chat_message_id": msg_id,
+        }
+        meta_json = json.dumps(meta, ensure_ascii=False)
+        # 참여자 수만큼 INSERT+commit 을 돌리는 대신
+        # multi-row INSERT 한 방 + commit 한 번으로
+        db.execute(
+            insert(models.UserNotification),
+            [
+                {
+                    "user_id": tid,
+                    "type": "deal_chat_message",
+                    "title": title,
+                    "message": message,
+                    "event_time": now,
+                    "meta_json": meta_json,
+                    "created_at": now,
+                }
+                for tid in target_ids
+            ],
+        )
+        db.commit()
+
+        # FCM 푸시는 기존처럼 대상별 best-effort
+        for tid in target_ids:
+            try:
+                _send_fcm_for_user(db, tid, title, message, meta)
+            except Exception:
+                pass
+    except Exception as notify_err:
+        # 알림 실패로 채팅이 막히면 안 되므로, 로그만 찍고 무시
+        import logging
+        logging.exception(
+            "failed to create deal_chat notification",
+            exc_info=notify_err,
+        )
+    finally:
+        db.close()
+
+
 # ============================================================
 # 1) 메시지 생성
 # ============================================================
@@ -86,6 +208,7 @@ def _make_display_name(db: Session, buyer_id: int) -> str:
 def api_create_deal_chat_message(
     deal_id: int,
     body: DealChatMessageCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -96,11 +219,16 @@ def api_create_deal_chat_message(
     """
     try:
         # 0) 딜 상태 체크: open 일 때만 작성 허용
-        deal = db.get(models.Deal, deal_id)
-        if not deal:
+        #    필요한 건 status 뿐 — 전체 Deal 행 hydration 생략
+        _deal_row = (
+            db.query(models.Deal.status)
+            .filter(models.Deal.id == deal_id)
+            .first()
+        )
+        if _deal_row is None:
             raise HTTPException(status_code=404, detail="Deal not found")
 
-        status = (getattr(deal, "status", None) or "open").lower()
+        status = (_deal_row[0] or "open").lower()
         if status != "open":
             # 딜 마감 이후에는 write 금지, read-only
             raise HTTPException(
@@ -132,47 +260,21 @@ def api_create_deal_chat_message(
                 created_at=msg.created_at,
             )
 
-        # 3) 🔔 알림 생성 트리거
-        #    - 동일 딜의 다른 참여자(buyer)에게만 알림 생성
-        try:
-            participants = (
-                db.query(models.DealParticipant)
-                  .filter(models.DealParticipant.deal_id == deal_id)
-                  .all()
-            )
-
-            # snippet 은 body.text 대신, 실제 저장된 msg.text 기준으로
-            snippet = (msg.text or "").strip()
-            if len(snippet) > 50:
-                snippet = snippet[:50] + "..."
-
-            for p in participants:
-                target_buyer_id = int(getattr(p, "buyer_id", 0) or 0)
-                if target_buyer_id <= 0:
-                    continue
-                if target_buyer_id == body.buyer_id:
-                    continue  # 자기 자신은 알림 제외
-
-                create_notification(
-                    db,
-                    user_id=target_buyer_id,
-                    type="deal_chat_message",
-                    title=f"딜 #{deal_id} 새 채팅 메시지",
-                    message=f"{sender_nickname}: {snippet}",
-                    meta={
-                        "role": "buyer",
-                        "deal_id": deal_id,
-                        "sender_buyer_id": body.buyer_id,
-                        "chat_message_id": msg.id,
-                    },
-                )
-        except Exception as notify_err:
-            # 알림 실패로 채팅이 막히면 안 되므로, 로그만 찍고 무시
-            import logging
-            logging.exception(
-                "failed to create deal_chat notification",
-                exc_info=notify_err,
-            )
+        # 3) 🔔 알림 생성 트리거 — 응답에 필요 없으므로 응답 경로 밖에서.
+        #    메시지 커밋만 기다리고, fanout 은 BackgroundTasks 로 넘긴다.
+        # snippet 은 body.text 대신, 실제 저장된 msg.text 기준으로
+        snippet = (msg.text or "").strip()
+        if len(snippet) > 50:
+            snippet = snippet[:50] + "..."
+
+        background_tasks.add_task(
+            _fanout_deal_chat_notifications,
+            deal_id,
+            msg.id,
+            body.buyer_id,
+            sender_nickname,
+            snippet,
+        )
 
         # 4) 응답
         return DealChatMessageOut(
@@ -219,9 +321,12 @@ def api_list_deal_chat_messages(
             q=q,
         )
 
+        # 닉네임은 메시지당 get() 대신 한 번에 조회 (N+1 제거)
+        _names = _make_display_name_map(db, (m.buyer_id for m in items))
+
         out_items: List[DealChatMessageOut] = []
         for m in items:
-            sender_nickname = _make_display_name(db, m.buyer_id)
+            sender_nickname = _names.get(m.buyer_id, f"buyer-{m.buyer_id}")
             out_items.append(
                 DealChatMessageOut(
                     id=m.id,
@@ -259,7 +364,7 @@ def api_list_deal_chat_messages(
         422: {"description": "Validation Error"},
     },
 )
-def api_export_deal_chat_messages(
+async def api_export_deal_chat_messages(
     deal_id: int,
     buyer_id: int = Query(..., description="요청하는 buyer_id (참여자인지 확인용)"),
     q: Optional[str] = Query(None, description="검색어 (텍스트 LIKE 검색)"),
@@ -267,74 +372,76 @@ def api_export_deal_chat_messages(
 ):
     """
     - 딜 참가자 여부 체크: list_deal_chat_messages 재사용
-    - 전체 메시지를 한 번에 CSV로 만들어서 응답
+    - 전체 CSV 를 메모리에 만들지 않고 행 단위로 스트리밍
+      (첫 바이트까지의 지연이 전체 인코딩이 아니라 조회 시간만큼)
+    - async 제너레이터로 내려보내되, 동기 세션 조회는 배치 단위로만
+      스레드풀에 넘겨서 청크마다 thread-hop 하지 않게 처리
     - UTF-8 + BOM 으로 저장해서 엑셀에서 한글 안 깨지게 처리
     """
     try:
-        # 참여자 체크 + 메시지 가져오기
-        items, _ = crud.list_deal_chat_messages(
+        # 참여자 체크 + 키셋 배치 제너레이터 (에러는 스트림 시작 전에 404/409 로,
+        # 10k 건 캡 없이 id 오름차순 = 대화 시간순)
+        batches = await run_in_threadpool(
+            crud.iter_deal_chat_messages,
             db,
             deal_id=deal_id,
             buyer_id=buyer_id,
-            limit=10_000,
-            offset=0,
             q=q,
         )
+    except Exception as e:
+        _xlate(e)
 
-        buf = StringIO()
-        writer = csv.writer(buf)
-
-        # 헤더
-        writer.writerow(
-            [
-                "id",
-                "deal_id",
-                "buyer_id",
-                "sender_nickname",
-                "text",
-                "blocked",
-                "blocked_reason",
-                "created_at",
-            ]
-        )
-
-        # 데이터 행
-        for m in items:
-            nickname = _make_display_name(db, m.buyer_id)
-
-            raw_text = m.text or ""
-            safe_text = raw_text
+    def _next_chunk() -> Optional[bytes]:
+        # DB 조회 + CSV 렌더링까지 배치 하나를 통째로 처리 (스레드풀에서 실행)
+        batch = next(batches, None)
+        if batch is None:
+            return None
+
+        # 닉네임은 배치당 IN(...) 한 방
+        _names = _make_display_name_map(db, (m.buyer_id for m in batch))
+
+        # 10k+ 행 루프 — 스키마가 8컬럼 고정이라 csv.writer 를 거치지 않고
+        # f-string 으로 직접 포맷한다 (인용이 필요한 문자열 컬럼만 _csv_quote)
+        _get_name = _names.get
+        _q = _csv_quote
+        lines = []
+        _append = lines.append
+        for m in batch:
+            m_buyer_id = m.buyer_id
+            nickname = _get_name(m_buyer_id, f"buyer-{m_buyer_id}")
+
+            safe_text = raw_text = m.text or ""
             # 전부 숫자로만 구성된 경우 → 엑셀에서 지수표기로 바뀌지 않게 ' 프리픽스
-            if raw_text.isdigit():
+            # (첫 글자만 먼저 보고 전체 isdigit 스캔은 숫자로 시작할 때만)
+            if raw_text[:1].isdigit() and raw_text.isdigit():
                 safe_text = "'" + raw_text
 
-            writer.writerow(
-                [
-                    m.id,
-                    m.deal_id,
-                    m.buyer_id,
-                    nickname,
-                    safe_text,
-                    bool(m.blocked),
-                    m.blocked_reason or "",
-                    m.created_at.isoformat() if m.created_at else "",
-                ]
+            created_at = m.created_at
+            _append(
+                f"{m.id},{m.deal_id},{m_buyer_id},{_q(nickname)},{_q(safe_text)},"
+                f"{bool(m.blocked)},{_q(m.blocked_reason or '')},"
+                f"{created_at.isoformat() if created_at else ''}\r\n"
             )
-
-        csv_text = buf.getvalue()
-        buf.close()
-
-        # 엑셀 한글 깨짐 방지를 위한 BOM 추가
-        csv_bytes = ("\ufeff" + csv_text).encode("utf-8-sig")
-
-        filename = f"deal_{deal_id}_chat_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.csv"
-
-        return Response(
-            content=csv_bytes,
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
-        )
-    except Exception as e:
-        _xlate(e)
\ No newline at end of file
+        return "".join(lines).encode("utf-8")
+
+    async def _iter_csv():
+        # 엑셀 한글 깨짐 방지용 BOM + 헤더 (고정 스키마 — 상수 바이트)
+        yield _EXPORT_BOM_HEADER
+
+        while True:
+            chunk = await run_in_threadpool(_next_chunk)
+            if chunk is None:
+                break
+            yield chunk
+
+    filename = f"deal_{deal_id}_chat_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.csv"
+
+    return StreamingResponse(
+        _iter_csv(),
+        media_type="text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            # nginx 등 리버스 프록시의 응답 버퍼링이 스트리밍을 무효화하지 않게
+            "X-Accel-Buffering": "no",
+        },
+    )
\ No newline at end of file
@@ -1,12 +1,14 @@
 # app/routers/deals.py
-from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Body, Query
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
+import json
 from typing import List, Optional
 import logging
-from app.database import get_db
+from app.database import get_db, SessionLocal
 
 from .. import crud, schemas, database, models
-from app.routers.notifications import create_notification
+from app.routers.notifications import create_notification, _send_fcm_for_user
 from datetime import datetime, timezone
 import logging
 from app.models import Deal
@@ -463,70 +465,95 @@ def read_deal(deal_id: int, db: Session = Depends(get_db)):
 # ---------------------------
 # ➕ Deal 참여자 추가 + 알림 트리거
 # ---------------------------
-@router.post("/{deal_id}/participants", response_model=schemas.DealParticipantOut)
-def add_participant(
-    deal_id: int,
-    participant: schemas.DealParticipantCreate,
-    db: Session = Depends(get_db),
-):
-    # deal_id 강제 설정 (schemas.DealParticipantCreate에 포함되었더라도 덮어쓰기)
-    participant.deal_id = deal_id
-    try:
-        db_participant = crud.add_participant(db=db, participant=participant)
-    except crud.ConflictError as e:
-        raise HTTPException(status_code=409, detail=str(e))
+def _fanout_participant_notifications(deal_id: int, new_buyer_id: int) -> None:
+    """참여자 알림 fanout — BackgroundTasks 에서 응답 이후 실행.
 
-    # 🔔 알림: 같은 딜에 참여한 다른 바이어들 + 방장에게 알림 보내기
+    요청 세션과 분리된 세션을 새로 연다.
+    실패해도 참여 자체에는 영향이 없어야 하므로 로그만 남긴다.
+    """
+    db = SessionLocal()
     try:
         deal = crud.get_deal(db, deal_id=deal_id)
         if not deal:
-            return db_participant  # 딜이 없으면 알림만 스킵
+            return  # 딜이 없으면 알림만 스킵
 
         product_name = getattr(deal, "product_name", "") or "딜"
         host_buyer_id = int(getattr(deal, "creator_id", 0) or 0)
 
         # 이 딜의 모든 참여자 조회 (나 포함)
-        all_participants = (
-            db.query(models.DealParticipant)
-              .filter(models.DealParticipant.deal_id == deal_id)
-              .all()
-        )
+        # 필요한 건 buyer_id 뿐이라 전체 ORM 행 hydration 없이 컬럼만 가져온다
+        participant_buyer_ids = [
+            bid
+            for (bid,) in db.query(models.DealParticipant.buyer_id)
+            .filter(models.DealParticipant.deal_id == deal_id)
+            .all()
+        ]
+
+        # 알림 행을 모아서 multi-row INSERT 한 방 + commit 한 번
+        # (대상별 create_notification 은 행마다 INSERT+commit 이라 참여자 수에 비례)
+        now = datetime.now(timezone.utc)
+        rows = []
+        fcm_targets = []  # (user_id, title, message, meta)
 
         # 1) 다른 바이어들에게 "새 참여자" 알림
-        for p in all_participants:
-            target_buyer_id = int(getattr(p, "buyer_id", 0) or 0)
-            if target_buyer_id <= 0:
-                continue
-            if target_buyer_id == participant.buyer_id:
-                continue  # 자기 자신에게는 안 보냄
-
-            create_notification(
-                db,
-                user_id=target_buyer_id,
-                type="deal_participated",
-                title=f"딜 #{deal_id}에 새 바이어가 참여했습니다.",
-                message=f'"{product_name}" 딜에 다른 바이어가 참여했습니다.',
-                meta={
-                    "role": "buyer",
-                    "deal_id": deal_id,
-                    "new_buyer_id": participant.buyer_id,
-                },
+        target_ids = {int(bid or 0) for bid in participant_buyer_ids}
+        target_ids.discard(0)
+        target_ids.discard(int(new_buyer_id))  # 자기 자신에게는 안 보냄
+
+        title = f"딜 #{deal_id}에 새 바이어가 참여했습니다."
+        message = f'"{product_name}" 딜에 다른 바이어가 참여했습니다.'
+        meta = {
+            "role": "buyer",
+            "deal_id": deal_id,
+            "new_buyer_id": new_buyer_id,
+        }
+        meta_json = json.dumps(meta, ensure_ascii=False)
+        for target_buyer_id in target_ids:
+            rows.append(
+                {
+                    "user_id": target_buyer_id,
+                    "type": "deal_participated",
+                    "title": title,
+                    "message": message,
+                    "event_time": now,
+                    "meta_json": meta_json,
+                    "created_at": now,
+                }
             )
+            fcm_targets.append((target_buyer_id, title, message, meta))
 
         # 2) 방장(딜 생성한 buyer)에게 별도 알림
-        if host_buyer_id and host_buyer_id != participant.buyer_id:
-            create_notification(
-                db,
-                user_id=host_buyer_id,
-                type="deal_participated_on_host",
-                title=f"내가 만든 딜 #{deal_id}에 참여자가 늘었습니다.",
-                message=f'"{product_name}" 딜에 바이어가 새로 참여했습니다.',
-                meta={
-                    "role": "buyer_host",
-                    "deal_id": deal_id,
-                    "new_buyer_id": participant.buyer_id,
-                },
+        if host_buyer_id and host_buyer_id != new_buyer_id:
+            host_title = f"내가 만든 딜 #{deal_id}에 참여자가 늘었습니다."
+            host_message = f'"{product_name}" 딜에 바이어가 새로 참여했습니다.'
+            host_meta = {
+                "role": "buyer_host",
+                "deal_id": deal_id,
+                "new_buyer_id": new_buyer_id,
+            }
+            rows.append(
+                {
+                    "user_id": host_buyer_id,
+                    "type": "deal_participated_on_host",
+                    "title": host_title,
+                    "message": host_message,
+                    "event_time": now,
+                    "meta_json": json.dumps(host_meta, ensure_ascii=False),
+                    "created_at": now,
+                }
             )
+            fcm_targets.append((host_buyer_id, host_title, host_message, host_meta))
+
+        if rows:
+            db.execute(insert(models.UserNotification), rows)
+            db.commit()
+
+        # FCM 푸시는 기존처럼 대상별 best-effort
+        for user_id, t, m, mt in fcm_targets:
+            try:
+                _send_fcm_for_user(db, user_id, t, m, mt)
+            except Exception:
+                logging.exception("[NOTI] deal_participated FCM push failed")
 
     except Exception as notify_err:
         # 알림 실패로 참여 자체가 막히면 안 되니까 그냥 로그만 찍고 무시
@@ -534,6 +561,31 @@ def add_participant(
             "failed to create deal_participated notification",
             exc_info=notify_err,
         )
+    finally:
+        db.close()
+
+
+@router.post("/{deal_id}/participants", response_model=schemas.DealParticipantOut)
+def add_participant(
+    deal_id: int,
+    participant: schemas.DealParticipantCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    # deal_id 강제 설정 (schemas.DealParticipantCreate에 포함되었더라도 덮어쓰기)
+    participant.deal_id = deal_id
+    try:
+        db_participant = crud.add_participant(db=db, participant=participant)
+    except crud.ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    # 🔔 알림: 같은 딜에 참여한 다른 바이어들 + 방장에게 알림 보내기
+    # API 계약에는 필요 없는 부가 작업이라 응답을 막지 않고 백그라운드로
+    background_tasks.add_task(
+        _fanout_participant_notifications,
+        deal_id,
+        int(participant.buyer_id),
+    )
 
     return db_participant
 
@@ -560,16 +612,102 @@ def remove_participant(participant_id: int, db: Session = Depends(get_db)):
 # ---------------------------
 # 🧪 [DEV] 마감 지난 딜 자동 종료 + 알림
 # ---------------------------
+def _fanout_deal_closed_notifications(closed_deals: list) -> None:
+    """deal_closed 알림 fanout — BackgroundTasks 에서 응답 이후 실행.
+
+    closed_deals: (deal_id, product_name, creator_id) 튜플 리스트
+    (마감된 배치 전체를 태스크 하나로 받는다 — 딜당 태스크 X)
+    """
+    db = SessionLocal()
+    try:
+        closed_ids = [deal_id for deal_id, _, _ in closed_deals]
+
+        # 참여자 목록은 딜별로 돌지 않고 한 번에 긁어서 deal_id 로 묶는다
+        # (필요한 컬럼만 — 전체 ORM 행 hydration 생략)
+        participant_rows = (
+            db.query(models.DealParticipant.deal_id, models.DealParticipant.buyer_id)
+            .filter(models.DealParticipant.deal_id.in_(closed_ids))
+            .all()
+        )
+        buyers_by_deal: dict = {}
+        for p_deal_id, p_buyer_id in participant_rows:
+            if p_buyer_id:
+                buyers_by_deal.setdefault(p_deal_id, set()).add(p_buyer_id)
+
+        # 알림은 대상별 create_notification(행마다 INSERT+commit) 대신
+        # 행 dict 를 모아서 multi-row INSERT 한 방 + commit 한 번
+        now = datetime.now(timezone.utc)
+        rows = []
+        fcm_targets = []  # (user_id, title, message, meta)
+        for deal_id, product_name, creator_id in closed_deals:
+            message = f"상품 '{product_name}' 딜이 마감되었습니다."
+            meta = {
+                "role": "buyer",
+                "deal_id": deal_id,
+                "status": "closed",
+            }
+            meta_json = json.dumps(meta, ensure_ascii=False)
+
+            # 1) 딜 생성자 알림
+            if creator_id:
+                title = f"딜 #{deal_id} 이 마감되었습니다"
+                rows.append(
+                    {
+                        "user_id": creator_id,
+                        "type": "deal_closed",
+                        "title": title,
+                        "message": message,
+                        "event_time": now,
+                        "meta_json": meta_json,
+                        "created_at": now,
+                    }
+                )
+                fcm_targets.append((creator_id, title, message, meta))
+
+            # 2) 참여자 알림
+            for buyer_id in buyers_by_deal.get(deal_id, ()):
+                title = f"참여 중인 딜 #{deal_id} 이 마감되었습니다"
+                rows.append(
+                    {
+                        "user_id": buyer_id,
+                        "type": "deal_closed",
+                        "title": title,
+                        "message": message,
+                        "event_time": now,
+                        "meta_json": meta_json,
+                        "created_at": now,
+                    }
+                )
+                fcm_targets.append((buyer_id, title, message, meta))
+
+        if rows:
+            db.execute(insert(models.UserNotification), rows)
+            db.commit()
+
+        # FCM 푸시는 기존처럼 대상별 best-effort
+        for user_id, title, message, meta in fcm_targets:
+            try:
+                _send_fcm_for_user(db, user_id, title, message, meta)
+            except Exception:
+                logging.exception("[NOTI] deal_closed FCM push failed")
+
+    except Exception:
+        logging.exception("[NOTI] deal_closed fanout failed")
+    finally:
+        db.close()
+
+
 @router.post(
     "/dev/close_expired",
     summary="[DEV] 마감 지난 딜 자동 종료 + 알림",
 )
 def dev_close_expired_deals(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
     - status='open' 이고 deadline_at < now 인 딜을 찾아 자동으로 'closed' 처리
-    - 딜 생성자 + 참여자들에게 알림 전송
+    - 딜 생성자 + 참여자들에게 알림 전송 (응답 이후 백그라운드)
     - 지금은 Swagger /dev 용으로 수동 호출
     """
     now = datetime.now(timezone.utc)
@@ -582,57 +720,29 @@ def dev_close_expired_deals(
     )
 
     deals = q.all()
-    closed_ids = []
-
-    for deal in deals:
-        deal.status = "closed"
-        closed_ids.append(deal.id)
-
-        # 참여자 목록
-        participants = (
-            db.query(models.DealParticipant)
-            .filter(models.DealParticipant.deal_id == deal.id)
-            .all()
-        )
-        buyer_ids = {p.buyer_id for p in participants if p.buyer_id}
-
-        # 1) 딜 생성자 알림
-        try:
-            if deal.creator_id:
-                create_notification(
-                    db,
-                    user_id=deal.creator_id,
-                    type="deal_closed",
-                    title=f"딜 #{deal.id} 이 마감되었습니다",
-                    message=f"상품 '{deal.product_name}' 딜이 마감되었습니다.",
-                    meta={
-                        "role": "buyer",
-                        "deal_id": deal.id,
-                        "status": "closed",
-                    },
-                )
-        except Exception:
-            logging.exception("[NOTI] deal_closed to creator failed")
+    closed_ids = [deal.id for deal in deals]
+
+    if not closed_ids:
+        return {"closed_deal_ids": [], "count": 0}
+
+    # 알림 태스크에 넘길 값은 commit 으로 ORM 객체가 expire 되기 전에 떠 둔다
+    closed_deals = [
+        (deal.id, deal.product_name, deal.creator_id)
+        for deal in deals
+    ]
+
+    # 상태 전환: 딜별 UPDATE N번 대신 IN(...) UPDATE 한 방
+    db.execute(
+        update(models.Deal)
+        .where(models.Deal.id.in_(closed_ids))
+        .values(status="closed"),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
 
-        # 2) 참여자 알림
-        for buyer_id in buyer_ids:
-            try:
-                create_notification(
-                    db,
-                    user_id=buyer_id,
-                    type="deal_closed",
-                    title=f"참여 중인 딜 #{deal.id} 이 마감되었습니다",
-                    message=f"상품 '{deal.product_name}' 딜이 마감되었습니다.",
-                    meta={
-                        "role": "buyer",
-                        "deal_id": deal.id,
-                        "status": "closed",
-                    },
-                )
-            except Exception:
-                logging.exception("[NOTI] deal_closed to participant failed")
+    # 알림 fanout 은 응답을 막지 않게 배치 하나를 태스크 하나로
+    background_tasks.add_task(_fanout_deal_closed_notifications, closed_deals)
 
-    db.commit()
     return {"closed_deal_ids": closed_ids, "count": len(closed_ids)}
 
 
@@ -741,6 +741,12 @@ def api_mark_reservation_shipped(
     except Exception as _e:
         logging.warning("[RESERVATION] attach_phase (shipped) failed: %s", _e)
 
+    try:
+        from app.routers.dashboard import invalidate_seller_dashboard_cache
+        invalidate_seller_dashboard_cache(body.seller_id)  # 배송 파이프라인/SLA 캐시 갱신
+    except Exception:
+        pass
+
     return resv
 
 
@@ -825,6 +831,19 @@ def api_arrival_confirm_reservation(
     except Exception as _e:
         logging.warning("[RESERVATION] attach_policy (arrival_confirm) failed: %s", _e)
 
+    # 8) 정산/파이프라인이 바뀌었으므로 셀러 대시보드 캐시 무효화
+    try:
+        from app.routers.dashboard import invalidate_seller_dashboard_cache
+        sid = (
+            db.query(models.Offer.seller_id)
+            .filter(models.Offer.id == resv.offer_id)
+            .scalar()
+        )
+        if sid:
+            invalidate_seller_dashboard_cache(sid)
+    except Exception:
+        pass
+
     return resv
 
 
@@ -1818,6 +1837,8 @@ def api_create_offer(
 ):
     try:
         offer = create_offer(db, body)
+        from app.routers.dashboard import invalidate_seller_dashboard_cache
+        invalidate_seller_dashboard_cache(getattr(offer, "seller_id", None))  # 오퍼 집계 캐시 갱신
         return offer
     except Exception as e:
         _translate_error(e)
@@ -1952,6 +1973,12 @@ def api_confirm_offer(
                 exc_info=notify_err,
             )
 
+        try:
+            from app.routers.dashboard import invalidate_seller_dashboard_cache
+            invalidate_seller_dashboard_cache(getattr(confirmed_offer, "seller_id", None))
+        except Exception:
+            pass
+
         return confirmed_offer
 
     except HTTPException:
@@ -39,6 +39,19 @@ def _translate_error(exc: Exception) -> None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal error")
 
+
+def _invalidate_seller_dash_for_offer(db: Session, offer_id: Optional[int]) -> None:
+    """예약 변화는 오퍼 소유 셀러의 대시보드 집계에도 반영됨 — FK 한 번으로 셀러를 찾아 캐시 무효화 (best-effort)."""
+    try:
+        if not offer_id:
+            return
+        sid = db.query(models.Offer.seller_id).filter(models.Offer.id == offer_id).scalar()
+        if sid:
+            from app.routers.dashboard import invalidate_seller_dashboard_cache
+            invalidate_seller_dashboard_cache(sid)
+    except Exception:
+        pass
+
 # -------------------------------------------------------------------
 # 예약 생성 (좌석 홀드)
 # -------------------------------------------------------------------
@@ -54,7 +67,7 @@ def reservations_create(
     db: Session = Depends(get_db),
 ):
     try:
-        return create_reservation(
+        out = create_reservation(
             db,
             deal_id=body.deal_id,
             offer_id=body.offer_id,
@@ -62,6 +75,10 @@ def reservations_create(
             qty=body.qty,
             hold_minutes=body.hold_minutes,  # ✅ 추가
         )
+        from app.routers.dashboard import invalidate_buyer_dashboard_cache
+        invalidate_buyer_dashboard_cache(body.buyer_id)  # 대시보드 예약 집계 캐시 갱신
+        _invalidate_seller_dash_for_offer(db, body.offer_id)
+        return out
 
 
     except Exception as e:
@@ -85,11 +102,15 @@ def reservations_pay_v35(
         resv = crud_get_reservation(db, body.reservation_id)
 
         # 2) 결제 수행 (CRUD는 v3.5 규칙으로 +20 고정 적립)
-        return pay_reservation_v35(
+        out = pay_reservation_v35(
             db,
             reservation_id=body.reservation_id,
             buyer_id=body.buyer_id,
         )
+        from app.routers.dashboard import invalidate_buyer_dashboard_cache
+        invalidate_buyer_dashboard_cache(body.buyer_id)  # 예약/포인트 둘 다 바뀜
+        _invalidate_seller_dash_for_offer(db, getattr(resv, "offer_id", None))
+        return out
     except Exception as e:
         _translate_error(e)
 
@@ -118,11 +139,15 @@ def reservations_cancel(
             raise ConflictError("not owned by buyer")
 
         # 3) 소유자가 맞으면 실제 취소 처리 (PENDING → CANCELLED)
-        return cancel_reservation(
+        out = cancel_reservation(
             db,
             reservation_id=body.reservation_id,
             buyer_id=body.buyer_id,
         )
+        from app.routers.dashboard import invalidate_buyer_dashboard_cache
+        invalidate_buyer_dashboard_cache(resv.buyer_id)
+        _invalidate_seller_dash_for_offer(db, getattr(resv, "offer_id", None))
+        return out
     except Exception as e:
         _translate_error(e)
 
@@ -144,11 +169,15 @@ def reservations_refund_paid(
     db: Session = Depends(get_db),
 ):
     try:
-        return refund_paid_reservation(
+        out = refund_paid_reservation(
             db,
             reservation_id=body.reservation_id,
             actor=body.actor,
         )
+        from app.routers.dashboard import invalidate_buyer_dashboard_cache
+        invalidate_buyer_dashboard_cache(getattr(out, "buyer_id", None))
+        _invalidate_seller_dash_for_offer(db, getattr(out, "offer_id", None))
+        return out
     except Exception as e:
         _translate_error(e)
 
@@ -227,6 +256,14 @@ def reservations_expire(
 ):
     try:
         n = expire_reservations(db)
+        if n:
+            # 어느 buyer/seller가 만료됐는지 모으지 않으므로 대시보드 캐시 전체를 비움
+            from app.routers.dashboard import (
+                invalidate_buyer_dashboard_cache,
+                invalidate_seller_dashboard_cache,
+            )
+            invalidate_buyer_dashboard_cache()
+            invalidate_seller_dashboard_cache()
         return {"expired": n}
     except Exception as e:
         _translate_error(e)
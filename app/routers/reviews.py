@@ -1,7 +1,9 @@
 from __future__ import annotations
 import html as _html
+import os
+import time as _time
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query, status
 from pydantic import BaseModel, Field
@@ -250,6 +252,9 @@ def create_review(body: ReviewIn = Body(...), db: Session = Depends(get_db)):
     db.commit()
     db.refresh(r)
 
+    # 새 리뷰 반영 — 레벨 캐시(메모+seller_rating_aggregates) 즉시 재계산
+    refresh_seller_level_cache(db, int(body.seller_id))
+
     # ✅ 알림: NEW_REVIEW → 판매자
     try:
         from app.services.notification_service import send_notification
@@ -526,13 +531,82 @@ def seller_level_info(
     return compute_seller_level_info(db, seller_id)
 
 
-def compute_seller_level_info(db: Session, seller_id: int) -> SellerLevelOut:
+# 레벨 계산 결과 60초 TTL 메모 — 같은 seller를 연달아 조회할 때 재집계 생략
+_LEVEL_MEMO: Dict[int, tuple[float, SellerLevelOut]] = {}
+_LEVEL_MEMO_TTL = 60.0
+
+# seller_rating_aggregates 에 박제된 레벨 캐시의 유효 시간(초).
+# 프로세스 재시작/멀티 워커에서도 메모와 달리 살아남는 2차 캐시.
+_LEVEL_DB_CACHE_TTL = float(os.environ.get("SELLER_LEVEL_CACHE_TTL", "300"))
+
+
+def _load_level_cache(db: Session, seller_id: int) -> Optional[SellerLevelOut]:
+    """seller_rating_aggregates 레벨 캐시가 신선하면 SellerLevelOut으로 복원."""
+    try:
+        row = (
+            db.query(models.SellerRatingAggregate)
+              .filter(models.SellerRatingAggregate.seller_id == seller_id)
+              .first()
+        )
+        if not row or not row.level or not row.last_computed_at:
+            return None
+        last = row.last_computed_at
+        now = datetime.now(timezone.utc) if last.tzinfo else datetime.utcnow()
+        if (now - last).total_seconds() >= _LEVEL_DB_CACHE_TTL:
+            return None
+        return SellerLevelOut(
+            seller_id=seller_id,
+            level=str(row.level),
+            fee_percent=float(row.fee_percent or 3.5),
+            rating_adjusted=round(float(row.rating_adjusted or 0.0), 3),
+            rating_count=int(row.reviews_count or 0),
+            total_orders=int(row.total_orders or 0),
+        )
+    except Exception:
+        return None
+
+
+def _store_level_cache(db: Session, out: SellerLevelOut) -> None:
+    """계산 결과를 seller_rating_aggregates 에 박제 (실패해도 조회 흐름은 유지)."""
+    try:
+        row = (
+            db.query(models.SellerRatingAggregate)
+              .filter(models.SellerRatingAggregate.seller_id == out.seller_id)
+              .first()
+        )
+        if not row:
+            row = models.SellerRatingAggregate(seller_id=out.seller_id)
+            db.add(row)
+        row.level = out.level
+        row.fee_percent = out.fee_percent
+        row.total_orders = out.total_orders
+        row.reviews_count = out.rating_count
+        row.rating_adjusted = out.rating_adjusted
+        row.last_computed_at = datetime.utcnow()
+        db.commit()
+    except Exception:
+        db.rollback()
+
+
+def compute_seller_level_info(db: Session, seller_id: int, *, use_cache: bool = True) -> SellerLevelOut:
     """
     Seller 레벨/수수료/평점/거래수 계산 공용 헬퍼.
     - _compute_seller_aggregates: 평점 집계 (가중+베이지안)
     - _get_seller_success_order_count: 성공 거래 수
     - _select_seller_level_rule: project_rules.SELLER_LEVEL_RULES 적용
+    결과는 60초 TTL 메모 → seller_rating_aggregates 레벨 캐시(기본 300초) →
+    풀 재집계 순서로 조회됨. use_cache=False 면 무조건 재집계 후 캐시 갱신.
     """
+    if use_cache:
+        cached = _LEVEL_MEMO.get(seller_id)
+        if cached is not None and _time.monotonic() - cached[0] < _LEVEL_MEMO_TTL:
+            return cached[1]
+
+        db_cached = _load_level_cache(db, seller_id)
+        if db_cached is not None:
+            _LEVEL_MEMO[seller_id] = (_time.monotonic(), db_cached)
+            return db_cached
+
     # 1) 평점 집계 (가중 + 베이지안 보정)
     agg = _compute_seller_aggregates(db, seller_id)
     rating = float(agg["adjusted"])
@@ -546,7 +620,7 @@ def compute_seller_level_info(db: Session, seller_id: int) -> SellerLevelOut:
     level = str(rule.get("level", "Lv.6"))
     fee = float(rule.get("fee_percent", 3.5))
 
-    return SellerLevelOut(
+    out = SellerLevelOut(
         seller_id=seller_id,
         level=level,
         fee_percent=fee,
@@ -554,6 +628,27 @@ def compute_seller_level_info(db: Session, seller_id: int) -> SellerLevelOut:
         rating_count=rating_count,
         total_orders=total_orders,
     )
+    _store_level_cache(db, out)
+    _LEVEL_MEMO[seller_id] = (_time.monotonic(), out)
+    return out
+
+
+def refresh_seller_level_cache(db: Session, seller_id: int) -> Optional[SellerLevelOut]:
+    """리뷰 작성 등 쓰기 이벤트 후 레벨 캐시(메모+DB)를 즉시 재계산."""
+    _LEVEL_MEMO.pop(int(seller_id), None)
+    try:
+        return compute_seller_level_info(db, seller_id, use_cache=False)
+    except Exception:
+        return None
+
+
+def compute_seller_level_info_bulk(db: Session, seller_ids: List[int]) -> Dict[int, SellerLevelOut]:
+    """
+    여러 seller의 레벨 정보를 한 번에 계산.
+    평점 보정 로직이 리뷰별 trust tier를 참조하므로 완전한 GROUP BY 한 방은
+    불가능하지만, TTL 메모를 공유해 목록 enrichment가 N+1 재집계로 퍼지지 않게 함.
+    """
+    return {sid: compute_seller_level_info(db, sid) for sid in seller_ids}
 
 
 
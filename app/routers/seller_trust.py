@@ -315,25 +315,5 @@ def api_insights_trends(db: Session = Depends(get_db)):
     }
 
 
-# ═══════════ 환불 시뮬레이터 v2 (12시나리오 완전 커버) ═══════════
-
-@router.get("/refund-simulator/calculate")
-def api_refund_simulate(
-    amount: int = Query(...),
-    shipping_fee: int = Query(0),
-    shipping_mode: str = Query("free"),
-    reason: str = Query("buyer_change_mind"),
-    delivery_status: str = Query("delivered"),
-    days_since_delivery: int = Query(0),
-    inspection_deduction_rate: float = Query(0.0),
-    role: str = Query("buyer"),
-    # legacy params (ignored but accepted for backward compat)
-    shipping_cost: int = Query(None),
-):
-    from app.services.refund_calculator import calculate_refund
-    return calculate_refund(
-        original_amount=amount, shipping_fee=shipping_fee,
-        shipping_mode=shipping_mode, reason=reason,
-        delivery_status=delivery_status, days_since_delivery=days_since_delivery,
-        inspection_deduction_rate=inspection_deduction_rate, role=role,
-    )
+# 환불 시뮬레이터는 refund.py의 GET /v3_6/refund-simulator/calculate 가 담당
+# (여기 있던 중복 정의는 먼저 등록된 refund 라우터에 가려져 죽은 코드였음)
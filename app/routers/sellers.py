@@ -320,6 +320,9 @@ def approve_seller_api(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to approve seller: {e}")
 
+    from app.routers.basic_info import invalidate_basic_cache
+    invalidate_basic_cache()  # /basic/sellers/* 캐시의 approval_status 갱신
+
     return seller
 
 
@@ -398,6 +401,10 @@ def update_seller_fields(
             setattr(seller, k, v)
     db.commit()
     db.refresh(seller)
+
+    from app.routers.basic_info import invalidate_basic_cache
+    invalidate_basic_cache()  # /basic/sellers/* 캐시에 이전 프로필이 남지 않게
+
     return {"id": seller.id, "updated": list(body.keys())}
 
 
@@ -6,6 +6,7 @@ print("✅ SECURITY MODULE LOADED:", __file__)
 
 import os
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -27,8 +28,14 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES",
 # 기본값 false → 환경변수 없으면 인증 강제
 DEV_BYPASS = os.environ.get("DEV_BYPASS", "false").lower() == "true"
 
+# 개발/테스트용 — 동일 자격증명 반복 로그인 시 bcrypt 재검증을 LRU 캐시로 생략
+# 평문 비밀번호가 메모리에 남으므로 프로덕션에서는 반드시 false
+AUTH_VERIFY_CACHE = os.environ.get("AUTH_VERIFY_CACHE", "false").lower() == "true"
+
 if DEV_BYPASS:
     print("⚠️  [SECURITY] DEV_BYPASS=True — 인증 우회 활성화. 프로덕션에서는 DEV_BYPASS=false로 설정하세요.")
+if AUTH_VERIFY_CACHE:
+    print("⚠️  [SECURITY] AUTH_VERIFY_CACHE=True — 비밀번호 검증 결과 캐시 활성화 (개발 전용).")
 if SECRET_KEY == "dev-only-change-in-production":
     import warnings
     warnings.warn("SECRET_KEY 기본값 사용 중 — 프로덕션에서는 반드시 변경하세요!", stacklevel=1)
@@ -44,7 +51,7 @@ def _bcrypt_secret_bytes(pw: str, *, limit_bytes: int = 72) -> bytes:
     b = (pw or "").encode("utf-8")
     return b[:limit_bytes]
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_password_uncached(plain_password: str, hashed_password: str) -> bool:
     # crud.py의 bcrypt_hash_password()가 bytes로 해싱하므로, 검증도 bytes로
     secret = _bcrypt_secret_bytes(plain_password, limit_bytes=72)
     try:
@@ -56,6 +63,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         except Exception:
             return False
 
+
+@lru_cache(maxsize=1024)
+def _verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    return _verify_password_uncached(plain_password, hashed_password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if AUTH_VERIFY_CACHE:
+        return _verify_password_cached(plain_password, hashed_password)
+    return _verify_password_uncached(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 